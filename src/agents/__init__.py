@@ -1,15 +1,22 @@
 """Package initialization files."""
 
-from .multi_agent_orchestrator import multi_agent_orchestrator
-from .query_analysis_agent import query_analysis_agent
-from .search_agent import search_agent
-from .security_agent import security_agent
-from .summary_agent import summary_agent
-
-__all__ = [
-    "multi_agent_orchestrator",
-    "query_analysis_agent",
-    "search_agent",
-    "security_agent",
-    "summary_agent",
-]
+import importlib
+from typing import Any
+
+# The orchestrator getter is imported lazily on first access (PEP 562). Agent instances are imported
+# from their own modules, since a package attribute of the same name turns into the submodule once
+# that is imported.
+__all__ = ["get_orchestrator"]
+
+
+def __getattr__(name: str) -> Any:
+    if name != "get_orchestrator":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(".multi_agent_orchestrator", __name__)
+    value = globals()[name] = module.get_orchestrator
+    return value
+
+
+def __dir__() -> list[str]:
+    return __all__
@@ -1,64 +1,81 @@
 """Multi-Agent Orchestrator for coordinating the 3 specialized agents."""
 
+import asyncio
+import contextlib
+import os
 import time
-import traceback
-from typing import Any, TypedDict
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
 
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from loguru import logger
 
-from ..config.settings import settings
-from ..models.schemas import ResearchResult
+from ..config.settings import get_settings
+from ..models.schemas import HITLQueryAnalysis, ResearchResult
 from ..vectorstore.faiss_store import vector_store
 from .query_analysis_agent import QueryAnalysisState, query_analysis_agent
-from .search_agent import SearchState, search_agent
+from .search_agent import search_agent
 from .security_agent import SecurityState, security_agent
 from .summary_agent import SummaryState, summary_agent
 
+# Most paper lists merged into one vector store write, and how long to wait for more
+VECTOR_STORE_BATCH_SIZE = 64
+VECTOR_STORE_BATCH_WINDOW = 0.05
 
-class MultiAgentState(TypedDict):
+# Seconds without new papers before the vector store index is written to disk
+VECTOR_STORE_SAVE_DEBOUNCE = 5.0
+
+# Longest time added papers stay unsaved while new papers keep arriving
+VECTOR_STORE_SAVE_MAX_DELAY = 60.0
+
+
+@dataclass(slots=True, kw_only=True)
+class MultiAgentState:
     """State for the multi-agent research system."""
 
     # Input
     research_query: str
-    conversation_history: list[dict[str, Any]]
+    conversation_history: list[dict[str, Any]] = field(default_factory=list)
 
     # Security Analysis
-    original_input: str
-    sanitized_input: str
-    is_safe: bool
-    threat_level: str
-    detected_threats: list[str]
+    original_input: str = ""
+    sanitized_input: str = ""
+    is_safe: bool = True
+    threat_level: str = "none"
+    detected_threats: list[str] = field(default_factory=list)
 
     # Query Analysis
-    original_query: str
-    analyzed_query: str
-    suggested_query: str | None
-    analysis_data: dict[str, Any] | None
-    requires_hitl: bool
+    original_query: str = ""
+    analyzed_query: str = ""
+    suggested_query: str | None = None
+    analysis_data: HITLQueryAnalysis | None = None
+    requires_hitl: bool = False
 
     # HITL Session
-    hitl_session_id: str | None
-    conversation_id: str | None
+    hitl_session_id: str | None = None
+    conversation_id: str | None = None
 
     # Search Results
-    papers: list
-    web_results: list[dict]
-    academic_results: list[dict]
+    papers: list = field(default_factory=list)
+    web_results: list[dict] = field(default_factory=list)
+    academic_results: list[dict] = field(default_factory=list)
 
     # Summary Results
-    summary: str
-    research_result: ResearchResult | None
+    summary: str = ""
+    research_result: ResearchResult | None = None
 
     # Control
-    current_step: str
-    error: str | None
+    current_step: str = "security"
+    error: str | None = None
 
 
 class MultiAgentOrchestrator:
     """Orchestrator for coordinating query analysis, search, and summary agents."""
 
+    # Compiled once per process; the nodes only use the global agent instances, so any orchestrator can share it
+    _compiled_graph: ClassVar[CompiledStateGraph | None] = None
+
     def __init__(self):
         """Initialize the multi-agent orchestrator."""
         self.name = "multi_agent_orchestrator"
@@ -71,15 +88,34 @@ class MultiAgentOrchestrator:
             "summary": summary_agent,
         }
 
-        # Build the graph
-        self.graph = self._build_graph()
-
-        # Save graph diagram
-        try:
-            with open(settings.researcher.graph_diagram_path, "wb") as f:
-                f.write(self.graph.get_graph(xray=1).draw_mermaid_png())
-        except Exception as e:
-            logger.warning(f"Could not save graph diagram: {e}")
+        # Vector store writes are batched by a background flusher started on first use
+        self._pending: asyncio.Queue[list] = asyncio.Queue()
+        self._flusher_task: asyncio.Task | None = None
+
+        # Index saves are debounced, so bursts of additions share a single write
+        self._save_task: asyncio.Task | None = None
+        self._save_due = 0.0
+        self._unsaved_since: float | None = None
+        self._save_now = asyncio.Event()
+
+        # Build the graph, reusing the compiled one if another orchestrator already built it
+        if MultiAgentOrchestrator._compiled_graph is None:
+            MultiAgentOrchestrator._compiled_graph = self._build_graph()
+        self.graph = MultiAgentOrchestrator._compiled_graph
+
+        # Save graph diagram once, rendering it is slow (an empty file is left over from an older failed render)
+        researcher_settings = get_settings().researcher
+        diagram_path = researcher_settings.graph_diagram_path
+        if researcher_settings.save_graph_diagram and not (
+            os.path.exists(diagram_path) and os.path.getsize(diagram_path) > 0
+        ):
+            try:
+                # Render before opening the file, so a failed render leaves no empty file behind
+                png = self.graph.get_graph(xray=1).draw_mermaid_png()
+                with open(diagram_path, "wb") as f:
+                    f.write(png)
+            except Exception as e:
+                logger.warning("Could not save graph diagram: {}", e)
 
         logger.info("Multi-Agent Orchestrator initialized")
 
@@ -100,65 +136,49 @@ class MultiAgentOrchestrator:
         Returns:
             Research result with papers and summary
         """
-        logger.info(f"Starting multi-agent research for query: {query}")
-        start_time = time.time()
+        logger.info("Starting multi-agent research for query: {}", query)
+        start_time = time.perf_counter()
 
         try:
             # Initialize state
-            initial_state: MultiAgentState = {
-                "research_query": query,
-                "conversation_history": conversation_history or [],
-                "conversation_id": conversation_id,
-                "original_input": query,
-                "sanitized_input": "",
-                "is_safe": True,
-                "threat_level": "none",
-                "detected_threats": [],
-                "original_query": query,
-                "analyzed_query": "",
-                "suggested_query": None,
-                "analysis_data": None,
-                "requires_hitl": False,
-                "hitl_session_id": None,
-                "papers": [],
-                "web_results": [],
-                "academic_results": [],
-                "summary": "",
-                "research_result": None,
-                "current_step": "security",
-                "error": None,
-            }
+            initial_state = MultiAgentState(
+                research_query=query,
+                conversation_history=conversation_history or [],
+                conversation_id=conversation_id,
+                original_input=query,
+                original_query=query,
+            )
 
             # Run the graph
-            final_state = await self.graph.ainvoke(initial_state)
+            final_state = MultiAgentState(**await self.graph.ainvoke(initial_state))
 
             # Calculate search time
-            search_time = time.time() - start_time
+            search_time = time.perf_counter() - start_time
 
             # Get research result
-            if final_state.get("research_result"):
-                result = final_state["research_result"]
+            if final_state.research_result:
+                result = final_state.research_result
                 result.search_time = search_time
             else:
                 # Fallback: create basic result
                 result = ResearchResult(
-                    papers=final_state.get("papers", []),
-                    total_found=len(final_state.get("papers", [])),
+                    papers=final_state.papers,
+                    total_found=len(final_state.papers),
                     search_query=query,
                     search_time=search_time,
                     sources=self._determine_sources(final_state),
                 )
 
-            logger.info(f"Multi-agent research completed in {search_time:.2f}s, found {len(result.papers)} papers")
+            logger.info("Multi-agent research completed in {:.2f}s, found {} papers", search_time, len(result.papers))
             return result
 
         except Exception as e:
-            logger.error(f"Error in multi-agent research: {traceback.format_exc()}")
+            logger.exception("Error in multi-agent research")
             return ResearchResult(
                 papers=[],
                 total_found=0,
                 search_query=query,
-                search_time=time.time() - start_time,
+                search_time=time.perf_counter() - start_time,
                 sources=[],
                 error=str(e),
             )
@@ -182,7 +202,7 @@ class MultiAgentOrchestrator:
 
         session = hitl_service.get_session(hitl_session_id)
         if not session:
-            logger.error(f"HITL session {hitl_session_id} not found")
+            logger.error("HITL session {} not found", hitl_session_id)
             return ResearchResult(
                 papers=[],
                 total_found=0,
@@ -192,58 +212,46 @@ class MultiAgentOrchestrator:
                 error="HITL session not found or expired",
             )
 
-        logger.info(f"Continuing research with confirmed query from session {hitl_session_id}: {confirmed_query}")
-        start_time = time.time()
+        logger.info("Continuing research with confirmed query from session {}: {}", hitl_session_id, confirmed_query)
+        start_time = time.perf_counter()
 
         try:
             # Initialize state for continuing from search
-            initial_state: MultiAgentState = {
-                "research_query": confirmed_query,
-                "conversation_history": [],
-                "conversation_id": session.conversation_id,
-                "original_input": confirmed_query,
-                "sanitized_input": confirmed_query,
-                "is_safe": True,
-                "threat_level": "none",
-                "detected_threats": [],
-                "original_query": confirmed_query,
-                "analyzed_query": session.original_query,  # Use original analysis
-                "suggested_query": None,
-                "analysis_data": session.analysis_data,
-                "requires_hitl": False,
-                "hitl_session_id": hitl_session_id,
-                "papers": [],
-                "web_results": [],
-                "academic_results": [],
-                "summary": "",
-                "research_result": None,
-                "current_step": "search",
-                "error": None,
-            }
+            initial_state = MultiAgentState(
+                research_query=confirmed_query,
+                conversation_id=session.conversation_id,
+                original_input=confirmed_query,
+                sanitized_input=confirmed_query,
+                original_query=confirmed_query,
+                analyzed_query=session.original_query,  # Use original analysis
+                analysis_data=session.analysis_data,
+                hitl_session_id=hitl_session_id,
+                current_step="search",
+            )
 
             # Execute search and summary directly
             state = await self._search_node(initial_state)
             final_state = await self._summary_node(state)
 
             # Calculate search time
-            search_time = time.time() - start_time
+            search_time = time.perf_counter() - start_time
 
             # Get research result
-            if final_state.get("research_result"):
-                result = final_state["research_result"]
+            if final_state.research_result:
+                result = final_state.research_result
                 result.search_time = search_time
             else:
                 # Fallback: create basic result
                 result = ResearchResult(
-                    papers=final_state.get("papers", []),
-                    total_found=len(final_state.get("papers", [])),
+                    papers=final_state.papers,
+                    total_found=len(final_state.papers),
                     search_query=confirmed_query,
                     search_time=search_time,
                     sources=self._determine_sources(final_state),
                 )
 
             logger.info(
-                f"Research with confirmed query completed in {search_time:.2f}s, found {len(result.papers)} papers"
+                "Research with confirmed query completed in {:.2f}s, found {} papers", search_time, len(result.papers)
             )
 
             # Clean up HITL session
@@ -252,12 +260,12 @@ class MultiAgentOrchestrator:
             return result
 
         except Exception as e:
-            logger.error(f"Error in continued research: {traceback.format_exc()}")
+            logger.exception("Error in continued research")
             return ResearchResult(
                 papers=[],
                 total_found=0,
                 search_query=confirmed_query,
-                search_time=time.time() - start_time,
+                search_time=time.perf_counter() - start_time,
                 sources=[],
                 error=str(e),
             )
@@ -267,13 +275,13 @@ class MultiAgentOrchestrator:
         """Determine which sources were used based on state."""
         sources = ["arxiv"]
 
-        if state.get("papers"):
+        if state.papers:
             sources.append("vector_store")
 
-        if state.get("web_results"):
+        if state.web_results:
             sources.append("web_search")
 
-        if state.get("academic_results"):
+        if state.academic_results:
             sources.append("academic_search")
 
         return sources
@@ -285,7 +293,9 @@ class MultiAgentOrchestrator:
         # Add nodes for each agent
         builder.add_node("security", self._security_node)
         builder.add_node("query_analysis", self._query_analysis_node)
-        builder.add_node("search", self._search_node)
+        builder.add_node("search_papers", self._search_papers_node)
+        builder.add_node("search_web", self._search_web_node)
+        builder.add_node("search", self._search_join_node)
         builder.add_node("summary", self._summary_node)
 
         # Add edges
@@ -298,33 +308,36 @@ class MultiAgentOrchestrator:
             {"continue": "query_analysis", "skip_to_summary": "summary"},
         )
 
-        # Conditional routing after query analysis (HITL check)
+        # Conditional routing after query analysis (HITL check), fanning out to the independent searches
         builder.add_conditional_edges(
             "query_analysis",
             self._should_continue_after_query_analysis,
-            {"continue": "search", "await_hitl": END},
+            {"search_papers": "search_papers", "search_web": "search_web", "await_hitl": END},
         )
+
+        # Join the parallel search branches before summarizing
+        builder.add_edge(["search_papers", "search_web"], "search")
         builder.add_edge("search", "summary")
         builder.add_edge("summary", END)
 
         return builder.compile()
 
     @staticmethod
-    def _should_continue_after_query_analysis(state: MultiAgentState) -> str:
-        """Determine whether to continue with search or await HITL confirmation."""
-        if state.get("requires_hitl", False):
+    def _should_continue_after_query_analysis(state: MultiAgentState) -> str | list[str]:
+        """Determine whether to continue with the parallel searches or await HITL confirmation."""
+        if state.requires_hitl:
             logger.info("Pausing workflow for HITL confirmation")
             action = "await_hitl"
         else:
             logger.info("Continuing with search")
-            action = "continue"
+            action = ["search_papers", "search_web"]
 
         return action
 
     @staticmethod
     def _should_continue_after_security(state: MultiAgentState) -> str:
         """Determine whether to continue with query analysis or skip to summary."""
-        if not state.get("is_safe", True):
+        if not state.is_safe:
             logger.info("Skipping query analysis due to security threat")
             decision = "skip_to_summary"
         else:
@@ -338,40 +351,33 @@ class MultiAgentOrchestrator:
         try:
             logger.info("Executing security node")
 
-            security_state: SecurityState = {
-                "original_input": state["research_query"],
-                "sanitized_input": "",
-                "is_safe": True,
-                "threat_level": "none",
-                "detected_threats": [],
-                "error": None,
-            }
+            security_state = SecurityState(original_input=state.research_query)
 
             result_state = await self.agents["security"].process_state(security_state)
 
             # Update state with security results
-            state["original_input"] = result_state["original_input"]
-            state["sanitized_input"] = result_state["sanitized_input"]
-            state["is_safe"] = result_state["is_safe"]
-            state["threat_level"] = result_state["threat_level"]
-            state["detected_threats"] = result_state["detected_threats"]
-            state["current_step"] = "query_analysis"
-            state["error"] = result_state.get("error")
+            state.original_input = result_state.original_input
+            state.sanitized_input = result_state.sanitized_input
+            state.is_safe = result_state.is_safe
+            state.threat_level = result_state.threat_level
+            state.detected_threats = result_state.detected_threats
+            state.current_step = "query_analysis"
+            state.error = result_state.error
 
             # Log security analysis results
-            if not state["is_safe"]:
-                logger.warning(f"Security threat detected: {state['threat_level']} - {state['detected_threats']}")
+            if not state.is_safe:
+                logger.warning("Security threat detected: {} - {}", state.threat_level, state.detected_threats)
             else:
                 logger.info("Security analysis passed - input is safe")
 
             return state
 
         except Exception as e:
-            logger.error(f"Error in security node: {traceback.format_exc()}")
-            state["error"] = str(e)
-            state["is_safe"] = False
-            state["threat_level"] = "critical"
-            state["sanitized_input"] = "artificial intelligence research"
+            logger.exception("Error in security node")
+            state.error = str(e)
+            state.is_safe = False
+            state.threat_level = "critical"
+            state.sanitized_input = "artificial intelligence research"
             return state
 
     async def _query_analysis_node(self, state: MultiAgentState) -> MultiAgentState:
@@ -380,7 +386,7 @@ class MultiAgentOrchestrator:
             logger.info("Executing query analysis node")
 
             # Use sanitized input from security analysis
-            input_query = state["sanitized_input"] if state["sanitized_input"] else state["research_query"]
+            input_query = state.sanitized_input if state.sanitized_input else state.research_query
 
             query_state: QueryAnalysisState = {
                 "original_query": input_query,
@@ -393,72 +399,99 @@ class MultiAgentOrchestrator:
 
             result_state = await self.agents["query_analysis"].process_state(query_state)
 
-            state["original_query"] = result_state["original_query"]
-            state["analyzed_query"] = result_state["analyzed_query"]
-            state["suggested_query"] = result_state.get("suggested_query")
-            state["analysis_data"] = result_state.get("analysis_data")
-            state["requires_hitl"] = result_state.get("requires_hitl", False)
-            state["error"] = result_state.get("error")
+            state.original_query = result_state["original_query"]
+            state.analyzed_query = result_state["analyzed_query"]
+            state.suggested_query = result_state.get("suggested_query")
+            state.analysis_data = result_state.get("analysis_data")
+            state.requires_hitl = result_state.get("requires_hitl", False)
+            state.error = result_state.get("error")
 
             # HITL is always enabled - create session if required
-            if state["requires_hitl"]:
+            if state.requires_hitl:
                 from ..services.hitl_service import hitl_service
 
                 session = hitl_service.create_session(
-                    original_query=state["original_query"],
-                    suggested_query=state["suggested_query"] or state["original_query"],
-                    analysis_data=state["analysis_data"] or {},
-                    conversation_id=state.get("conversation_id"),
+                    original_query=state.original_query,
+                    suggested_query=state.suggested_query or state.original_query,
+                    analysis_data=state.analysis_data or HITLQueryAnalysis(),
+                    conversation_id=state.conversation_id,
                 )
-                state["hitl_session_id"] = session.session_id
-                logger.info(f"Created HITL session {session.session_id} - awaiting user confirmation")
+                state.hitl_session_id = session.session_id
+                logger.info("Created HITL session {} - awaiting user confirmation", session.session_id)
             else:
-                state["current_step"] = "search"
+                state.current_step = "search"
 
-            logger.info(f"Query analysis completed: '{state['original_query']}' -> '{state['analyzed_query']}'")
+            logger.info("Query analysis completed: '{}' -> '{}'", state.original_query, state.analyzed_query)
 
             return state
 
         except Exception as e:
-            logger.error(f"Error in query analysis node: {traceback.format_exc()}")
-            state["error"] = str(e)
-            state["analyzed_query"] = state["research_query"]  # Fallback to original
-            state["requires_hitl"] = False
+            logger.exception("Error in query analysis node")
+            state.error = str(e)
+            state.analyzed_query = state.research_query  # Fallback to original
+            state.requires_hitl = False
             return state
 
     async def _search_node(self, state: MultiAgentState) -> MultiAgentState:
-        """Search node."""
+        """Search node running the paper and web searches concurrently outside the graph."""
+        papers_update, web_update = await asyncio.gather(
+            self._search_papers_node(state),
+            self._search_web_node(state),
+        )
+        for key, value in (papers_update | web_update).items():
+            setattr(state, key, value)
+
+        return await self._search_join_node(state)
+
+    async def _search_papers_node(self, state: MultiAgentState) -> dict[str, Any]:
+        """Paper search branch: ArXiv plus similar papers from the vector store."""
         try:
-            logger.info("Executing search node")
+            logger.info("Executing paper search node")
 
             # Use analyzed query for search
-            search_query = state["analyzed_query"] or state["research_query"]
+            search_query = state.analyzed_query or state.research_query
 
-            search_state: SearchState = {
-                "query": search_query,
-                "papers": [],
-                "web_results": [],
-                "error": None,
-            }
+            # ArXiv and the vector store are independent, query both at once and dedup afterwards
+            papers, similar_papers = await asyncio.gather(
+                self.agents["search"].search_papers(search_query),
+                self.agents["search"].search_vector_store(search_query),
+            )
+            papers = self.agents["search"].merge_papers(papers, similar_papers)
 
-            result_state = await self.agents["search"].process_state(search_state)
+            # Parallel branches only return the keys they own
+            return {"papers": papers}
 
-            state["papers"] = result_state["papers"]
-            state["web_results"] = result_state["web_results"]
-            state["academic_results"] = result_state["academic_results"]
-            state["current_step"] = "summary"
-            state["error"] = result_state.get("error")
+        except Exception:
+            logger.exception("Error in paper search node")
+            return {"papers": []}
 
-            logger.info(
-                f"Search completed: {len(state['papers'])} papers, {len(state['web_results'])} web results, {len(state['academic_results'])} academic results"
-            )
+    async def _search_web_node(self, state: MultiAgentState) -> dict[str, Any]:
+        """Web search branch."""
+        try:
+            logger.info("Executing web search node")
 
-            return state
+            # Use analyzed query for search
+            search_query = state.analyzed_query or state.research_query
 
-        except Exception as e:
-            logger.error(f"Error in search node: {traceback.format_exc()}")
-            state["error"] = str(e)
-            return state
+            return {"web_results": await self.agents["search"].web_search(search_query)}
+
+        except Exception:
+            logger.exception("Error in web search node")
+            return {"web_results": []}
+
+    @staticmethod
+    async def _search_join_node(state: MultiAgentState) -> MultiAgentState:
+        """Join node collecting the results of the parallel search branches."""
+        state.current_step = "summary"
+
+        logger.info(
+            "Search completed: {} papers, {} web results, {} academic results",
+            len(state.papers),
+            len(state.web_results),
+            len(state.academic_results),
+        )
+
+        return state
 
     async def _summary_node(self, state: MultiAgentState) -> MultiAgentState:
         """Summary node."""
@@ -466,32 +499,30 @@ class MultiAgentOrchestrator:
             logger.info("Executing summary node")
 
             # Check if we skipped processing due to security threats
-            if not state.get("is_safe", True):
+            if not state.is_safe:
                 logger.info("Creating security-aware summary for unsafe query")
-                state["summary"] = (
-                    f"Security analysis detected a {state.get('threat_level', 'unknown')} level threat in the query. The query has been sanitized and processed safely. No research results were generated due to security concerns."
-                )
+                state.summary = f"Security analysis detected a {state.threat_level} level threat in the query. The query has been sanitized and processed safely. No research results were generated due to security concerns."
 
                 # Create a minimal research result
-                state["research_result"] = ResearchResult(
-                    search_query=state["research_query"],
-                    summary=state["summary"],
+                state.research_result = ResearchResult(
+                    search_query=state.research_query,
+                    summary=state.summary,
                     papers=[],
                     sources=["security_analysis"],
                     total_found=0,
                     search_time=0.0,
-                    error=state.get("error"),
+                    error=state.error,
                 )
 
-                state["current_step"] = "completed"
+                state.current_step = "completed"
                 return state
 
             # Normal summary processing for safe queries
             summary_state: SummaryState = {
-                "papers": state["papers"],
-                "web_results": state["web_results"],
-                "academic_results": state["academic_results"],
-                "query": state["research_query"],
+                "papers": state.papers,
+                "web_results": state.web_results,
+                "academic_results": state.academic_results,
+                "query": state.research_query,
                 "summary": "",
                 "research_result": None,
                 "error": None,
@@ -499,32 +530,111 @@ class MultiAgentOrchestrator:
 
             result_state = await self.agents["summary"].process_state(summary_state)
 
-            state["summary"] = result_state["summary"]
-            state["research_result"] = result_state["research_result"]
-            state["current_step"] = "completed"
-            state["error"] = result_state.get("error")
+            state.summary = result_state["summary"]
+            state.research_result = result_state["research_result"]
+            state.current_step = "completed"
+            state.error = result_state.get("error")
 
             logger.info("Summary completed")
 
             return state
 
         except Exception as e:
-            logger.error(f"Error in summary node: {traceback.format_exc()}")
-            state["error"] = str(e)
+            logger.exception("Error in summary node")
+            state.error = str(e)
             return state
 
-    @staticmethod
-    def add_papers_to_vector_store(papers: list) -> None:
-        """Add papers to the vector store for future similarity search."""
-        try:
-            logger.info(f"Adding {len(papers)} papers to vector store")
-            vector_store.add_papers(papers)
-            vector_store.save_index()
-            logger.info("Successfully added papers to vector store")
-
-        except Exception:
-            logger.error(f"Error adding papers to vector store: {traceback.format_exc()}")
-
-
-# Global multi-agent orchestrator instance
-multi_agent_orchestrator = MultiAgentOrchestrator()
+    def add_papers_to_vector_store(self, papers: list) -> None:
+        """Queue papers for the vector store, they are added and saved in the background."""
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flusher())
+
+        self._pending.put_nowait(papers)
+        logger.info("Queued {} papers for vector store", len(papers))
+
+    async def flush_vector_store(self) -> None:
+        """Wait until all queued papers are added to the vector store and saved."""
+        if self._flusher_task is not None and not self._flusher_task.done():
+            await self._pending.join()
+
+        # Save right away instead of waiting out the debounce window
+        if self._save_task is not None and not self._save_task.done():
+            self._save_due = 0.0
+            self._save_now.set()
+            await self._save_task
+
+    async def _flusher(self) -> None:
+        """Add queued papers to the vector store in batches and schedule an index save."""
+        while True:
+            batch = [await self._pending.get()]
+
+            # Collect whatever else arrives shortly after, so one save covers many requests
+            while len(batch) < VECTOR_STORE_BATCH_SIZE:
+                try:
+                    batch.append(await asyncio.wait_for(self._pending.get(), VECTOR_STORE_BATCH_WINDOW))
+                except TimeoutError:
+                    break
+
+            try:
+                papers = [paper for papers in batch for paper in papers]
+                logger.info("Adding {} papers to vector store", len(papers))
+                # Embedding the papers blocks on the network, the store locks itself against concurrent use
+                await asyncio.to_thread(vector_store.add_papers, papers)
+                self._schedule_save()
+                logger.info("Successfully added papers to vector store")
+
+            except Exception:
+                logger.exception("Error adding papers to vector store")
+
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+    def _schedule_save(self) -> None:
+        """Push the index save back by the debounce window, starting the saver if needed."""
+        now = time.monotonic()
+        if self._unsaved_since is None:
+            self._unsaved_since = now
+
+        # A steady stream of papers must not postpone the save forever
+        self._save_due = min(now + VECTOR_STORE_SAVE_DEBOUNCE, self._unsaved_since + VECTOR_STORE_SAVE_MAX_DELAY)
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._delayed_save())
+
+    async def _delayed_save(self) -> None:
+        """Save the index once no papers were added for the debounce window."""
+        while True:
+            while (delay := self._save_due - time.monotonic()) > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._save_now.wait(), delay)
+            self._save_now.clear()
+
+            started = time.monotonic()
+            self._unsaved_since = None
+            try:
+                await asyncio.to_thread(vector_store.save_index)
+            except Exception:
+                logger.exception("Error saving vector store index")
+
+            # Papers added while saving need another write
+            if self._save_due <= started:
+                return
+
+
+# Global multi-agent orchestrator instance, built on first use
+_instance: MultiAgentOrchestrator | None = None
+
+
+def get_orchestrator() -> MultiAgentOrchestrator:
+    """Get the global multi-agent orchestrator, building it on first call."""
+    global _instance
+    if _instance is None:
+        _instance = MultiAgentOrchestrator()
+    return _instance
+
+
+def __getattr__(name: str) -> Any:
+    # Backward compatible lazy alias for the global instance
+    if name == "multi_agent_orchestrator":
+        return get_orchestrator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
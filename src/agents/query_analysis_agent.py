@@ -1,12 +1,74 @@
 """Query Analysis Agent for analyzing and optimizing research queries."""
 
-import json
-import traceback
-from typing import Any, TypedDict
+import asyncio
+import re
+from typing import TypedDict
 
 from loguru import logger
-
-from ..services.llm_service import llm_service
+from pydantic import ValidationError
+
+from ..config.settings import get_settings
+from ..models.schemas import HITLQueryAnalysis
+from ..services.llm_cache import llm_cache
+
+# Markdown code fence the LLM sometimes wraps around JSON output
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+
+# Lead-ins the LLM sometimes puts before the improved query, lowercase for str.startswith(tuple)
+_RESPONSE_PREFIXES = (
+    "here is the improved query:",
+    "here is the optimized query:",
+    "here's the improved query:",
+    "improved query:",
+    "optimized query:",
+    "refined query:",
+    "suggested query:",
+)
+
+# Static system prompts, built once at import. They are sent as an identical leading system message
+# on every call, so LLM backends can serve them from their prompt prefix cache.
+ANALYSIS_SYSTEM_PROMPT = """\
+You are a query summarizer. Your job is to analyze user queries and provide
+a clear, concise summary in JSON format.
+
+Analyze the user query and provide a JSON object that summarizes:
+- The main topic or subject
+- The specific aspect or focus area
+- Any key terms or concepts mentioned
+
+Return ONLY a JSON object with this structure:
+{
+    "main_topic": "primary subject area",
+    "focus_area": "specific aspect being asked about",
+    "key_terms": ["term1", "term2", "term3"],
+    "query_summary": "concise summary of what the user is asking"
+}
+
+Do not include any other text, explanations, or additional data.
+"""
+
+IMPROVEMENT_SYSTEM_PROMPT = """\
+You are an expert at refining research queries to improve search results.
+Your job is to take a user's query and suggest an improved, more specific version
+that would yield better academic research results.
+
+Generate an improved version of the user's query that:
+- Is more specific and focused
+- Uses appropriate academic/technical terminology
+- Maintains the user's intent
+- Would yield better search results in academic databases
+
+Return ONLY the improved query text, without any explanations or additional text.
+"""
+
+# User message template for the improved query when analysis context is available
+IMPROVEMENT_CONTEXT_USER_TEMPLATE = """\
+{query}
+
+Analysis Context:
+- Main Topic: {main_topic}
+- Focus Area: {focus_area}
+- Key Terms: {key_terms}"""
 
 
 class QueryAnalysisState(TypedDict):
@@ -15,7 +77,7 @@ class QueryAnalysisState(TypedDict):
     original_query: str
     analyzed_query: str
     suggested_query: str | None
-    analysis_data: dict[str, Any] | None
+    analysis_data: HITLQueryAnalysis | None
     requires_hitl: bool
     error: str | None
 
@@ -26,9 +88,10 @@ class QueryAnalysisAgent:
     def __init__(self):
         """Initialize the query analysis agent."""
         self.name = "query_analysis_agent"
+
         logger.info("Query Analysis Agent initialized with HITL enabled")
 
-    async def analyze_query(self, query: str) -> tuple[str, dict[str, Any] | None]:
+    async def analyze_query(self, query: str) -> tuple[str, HITLQueryAnalysis | None]:
         """
         Summarize the user query and return it in JSON format.
 
@@ -36,57 +99,46 @@ class QueryAnalysisAgent:
             query: The original research query (already sanitized by security agent)
 
         Returns:
-            Tuple of (JSON string containing summarized query, analysis data dict)
+            Tuple of (JSON string containing summarized query, parsed analysis data)
         """
+        # Short plain keyword queries need no summarizing, so build the analysis without the LLM
+        if get_settings().query_analysis.skip_llm_for_trivial and self._is_trivial_query(query):
+            analysis_data = HITLQueryAnalysis(
+                main_topic=query,
+                focus_area=query,
+                key_terms=query.split(),
+                query_summary=query,
+            )
+            logger.info("Query analysis skipped LLM for trivial query: {}", query)
+            return analysis_data.model_dump_json(), analysis_data
+
         try:
-            logger.info(f"Analyzing query: {query}")
+            logger.info("Analyzing query: {}", query)
 
             # Use LLM to summarize the query and format as JSON
-            analysis_prompt = f"""
-            SYSTEM:
-            You are a query summarizer. Your job is to analyze user queries and provide 
-            a clear, concise summary in JSON format.
-            
-            USER QUERY TO SUMMARIZE:
-            {query}
-            
-            Please analyze this query and provide a JSON object that summarizes:
-            - The main topic or subject
-            - The specific aspect or focus area
-            - Any key terms or concepts mentioned
-            
-            Return ONLY a JSON object with this structure:
-            {{
-                "main_topic": "primary subject area",
-                "focus_area": "specific aspect being asked about", 
-                "key_terms": ["term1", "term2", "term3"],
-                "query_summary": "concise summary of what the user is asking"
-            }}
-            
-            Do not include any other text, explanations, or additional data.
-            """
-
-            response = await llm_service.ainvoke_chat(analysis_prompt)
-            response_text = response.strip()
-
-            # Parse JSON response to extract analysis data
-            analysis_data = None
+            response = await llm_cache.ainvoke_chat(
+                query, query=query, cache_namespace="query_analysis", system=ANALYSIS_SYSTEM_PROMPT
+            )
+            response_text = _CODE_FENCE.sub("", response.strip())
+
+            # Parse and validate JSON response in a single pass
             try:
-                analysis_data = json.loads(response_text)
-            except json.JSONDecodeError:
-                logger.warning(f"Could not parse analysis response as JSON: {response_text[:100]}")
+                analysis_data = HITLQueryAnalysis.model_validate_json(response_text)
+            except ValidationError:
+                logger.warning("Could not parse analysis response as JSON: {}", response_text[:100])
+                # Fall back to the original query rather than passing malformed output downstream
+                return query, None
 
-            # Return the JSON response directly
-            logger.info(f"Query analysis completed: '{query}' -> JSON summary received")
-            return response_text, analysis_data
+            # Return the validated analysis as canonical JSON
+            logger.info("Query analysis completed: '{}' -> JSON summary received", query)
+            return analysis_data.model_dump_json(), analysis_data
 
         except Exception:
-            logger.error(f"Error analyzing query: {traceback.format_exc()}")
+            logger.exception("Error analyzing query")
             # Return original query if analysis fails
             return query, None
 
-    @staticmethod
-    async def _suggest_improved_query(query: str, analysis_data: dict[str, Any] | None = None) -> str:
+    async def _suggest_improved_query(self, query: str, analysis_data: HITLQueryAnalysis | None = None) -> str:
         """
         Generate an improved version of the query for better research results.
 
@@ -98,47 +150,52 @@ class QueryAnalysisAgent:
             Suggested improved query
         """
         try:
-            logger.info(f"Generating improved query suggestion for: {query}")
+            logger.info("Generating improved query suggestion for: {}", query)
 
-            context_info = ""
             if analysis_data:
-                context_info = f"""
-                Analysis Context:
-                - Main Topic: {analysis_data.get("main_topic", "N/A")}
-                - Focus Area: {analysis_data.get("focus_area", "N/A")}
-                - Key Terms: {", ".join(analysis_data.get("key_terms", []))}
-                """
-
-            improvement_prompt = f"""
-            SYSTEM:
-            You are an expert at refining research queries to improve search results.
-            Your job is to take a user's query and suggest an improved, more specific version
-            that would yield better academic research results.
-            
-            ORIGINAL QUERY:
-            {query}
-            {context_info}
-            
-            Generate an improved version of this query that:
-            - Is more specific and focused
-            - Uses appropriate academic/technical terminology
-            - Maintains the user's intent
-            - Would yield better search results in academic databases
-            
-            Return ONLY the improved query text, without any explanations or additional text.
-            """
-
-            improved_query = await llm_service.ainvoke_chat(improvement_prompt)
-            improved_query = improved_query.strip()
-
-            logger.info(f"Generated improved query: '{improved_query}'")
+                user_prompt = IMPROVEMENT_CONTEXT_USER_TEMPLATE.format(
+                    query=query,
+                    main_topic=analysis_data.main_topic or "N/A",
+                    focus_area=analysis_data.focus_area or "N/A",
+                    key_terms=", ".join(analysis_data.key_terms),
+                )
+            else:
+                user_prompt = query
+
+            response = await llm_cache.ainvoke_chat(
+                user_prompt, query=query, cache_namespace="query_improvement", system=IMPROVEMENT_SYSTEM_PROMPT
+            )
+            improved_query = self._clean_response(response)
+
+            logger.info("Generated improved query: '{}'", improved_query)
             return improved_query
 
         except Exception:
-            logger.error(f"Error generating improved query: {traceback.format_exc()}")
+            logger.exception("Error generating improved query")
             # Return original query if improvement fails
             return query
 
+    @staticmethod
+    def _clean_response(response: str) -> str:
+        """Strip a known lead-in and surrounding quotes from a plain-text LLM response."""
+        cleaned = response.strip()
+
+        lowered = cleaned.lower()
+        if lowered.startswith(_RESPONSE_PREFIXES):
+            prefix = next(prefix for prefix in _RESPONSE_PREFIXES if lowered.startswith(prefix))
+            cleaned = cleaned[len(prefix) :].strip()
+
+        if len(cleaned) >= 2 and cleaned[0] == cleaned[-1] and cleaned[0] in ('"', "'"):
+            cleaned = cleaned[1:-1].strip()
+
+        return cleaned
+
+    @staticmethod
+    def _is_trivial_query(query: str) -> bool:
+        """Check if the query is a short run of plain words, like "diffusion models"."""
+        tokens = query.split()
+        return 3 <= len(query) <= 80 and len(tokens) <= 8 and all(token.replace("-", "").isalnum() for token in tokens)
+
     async def process_state(self, state: QueryAnalysisState) -> QueryAnalysisState:
         """
         Process the query analysis state.
@@ -151,22 +208,25 @@ class QueryAnalysisAgent:
         """
         try:
             original_query = state["original_query"]
-            analyzed_query, analysis_data = await self.analyze_query(original_query)
+
+            # Analysis and improved query suggestion (HITL always enabled) are independent LLM calls,
+            # so run them concurrently; the suggestion is generated without the analysis context
+            (analyzed_query, analysis_data), suggested_query = await asyncio.gather(
+                self.analyze_query(original_query),
+                self._suggest_improved_query(original_query),
+            )
 
             state["analyzed_query"] = analyzed_query
             state["analysis_data"] = analysis_data
             state["error"] = None
-
-            # Generate improved query suggestion (HITL always enabled)
-            suggested_query = await self._suggest_improved_query(original_query, analysis_data)
             state["suggested_query"] = suggested_query
             state["requires_hitl"] = True
-            logger.info(f"HITL - suggested query: {suggested_query}")
+            logger.info("HITL - suggested query: {}", suggested_query)
 
             return state
 
         except Exception as e:
-            logger.error(f"Error processing query analysis state: {traceback.format_exc()}")
+            logger.exception("Error processing query analysis state")
             state["error"] = str(e)
             state["analyzed_query"] = state["original_query"]  # Fallback to original
             state["suggested_query"] = None
@@ -1,24 +1,33 @@
 """Search Agent for handling ArXiv, web, and academic search functionality."""
 
-import traceback
-from typing import TypedDict
+import asyncio
+import itertools
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 
 from loguru import logger
 
-from ..config.settings import settings
+from ..config.settings import get_settings
 from ..models.schemas import Paper
 from ..tools.arxiv_tool import ArxivTool, RecentPapersTool
 from ..tools.web_search_tool import WebSearchTool
 from ..vectorstore.faiss_store import vector_store
 
+# Shared bound on in-flight search requests to external services
+HTTP_SEM = asyncio.Semaphore(32)
 
-class SearchState(TypedDict):
+# Bound on concurrent ArXiv category queries, ArXiv rate limits bursts
+ARXIV_SEM = asyncio.Semaphore(get_settings().researcher.arxiv_max_concurrency or 5)
+
+
+@dataclass(slots=True, kw_only=True)
+class SearchState:
     """State for search agent."""
 
     query: str
-    papers: list[Paper]
-    web_results: list[dict]
-    error: str | None
+    papers: list[Paper] = field(default_factory=list)
+    web_results: list[dict] = field(default_factory=list)
+    error: str | None = None
 
 
 class SearchAgent:
@@ -28,13 +37,22 @@ class SearchAgent:
         """Initialize the search agent."""
         self.name = "search_agent"
 
-        # Initialize tools
+        # Initialize tools once and reuse them on every request
+        self.arxiv_tool = ArxivTool()
+        self.recent_papers_tool = RecentPapersTool()
+        self.web_search_tool = WebSearchTool()
         self.tools = {
-            "arxiv": ArxivTool(),
-            "recent_papers": RecentPapersTool(),
-            "web_search": WebSearchTool(),
+            "arxiv": self.arxiv_tool,
+            "recent_papers": self.recent_papers_tool,
+            "web_search": self.web_search_tool,
         }
 
+        # Search limits read once instead of through the settings tree on every call
+        settings = get_settings()
+        self.max_papers_per_query = settings.researcher.max_papers_per_query
+        self.web_search_max_results = settings.web_search.max_results
+        self.similarity_threshold = settings.vector_store.similarity_threshold
+
         logger.info("Search Agent initialized")
 
     async def search_papers(self, query: str) -> list[Paper]:
@@ -48,19 +66,20 @@ class SearchAgent:
             List of found papers
         """
         try:
-            logger.info(f"Searching papers for: {query}")
+            logger.info("Searching papers for: {}", query)
 
             # Use ArXiv tool to search for papers
-            papers = await self.tools["arxiv"]._arun(
-                query=query,
-                max_results=settings.researcher.max_papers_per_query,
-            )
+            async with HTTP_SEM:
+                papers = await self.arxiv_tool._arun(
+                    query=query,
+                    max_results=self.max_papers_per_query,
+                )
 
-            logger.info(f"Found {len(papers)} papers from ArXiv")
+            logger.info("Found {} papers from ArXiv", len(papers))
             return papers
 
         except Exception:
-            logger.error(f"Error searching papers: {traceback.format_exc()}")
+            logger.exception("Error searching papers")
             return []
 
     async def search_recent_papers(self, query: str, categories: list[str] = None) -> list[Paper]:
@@ -78,68 +97,65 @@ class SearchAgent:
             if categories is None:
                 categories = ["cs.AI", "cs.LG", "cs.CV"]
 
-            logger.info(f"Searching recent papers in categories: {categories}")
+            logger.info("Searching recent papers in categories: {}", categories)
 
-            all_papers = []
-            papers_per_category = settings.researcher.max_papers_per_query // len(categories)
+            max_papers = self.max_papers_per_query
+            papers_per_category = max_papers // len(categories)
 
-            for category in categories:
-                try:
-                    papers = await self.tools["recent_papers"]._arun(
-                        category=category, days_back=7, max_results=papers_per_category
-                    )
-                    all_papers.extend(papers)
-                except Exception as e:
-                    logger.warning(f"Error searching recent papers in {category}: {e}")
-                    continue
+            # Categories are independent, query them concurrently
+            results = await asyncio.gather(
+                *(self._fetch_recent_papers(category, papers_per_category) for category in categories)
+            )
+            # Papers cross-listed in several categories are kept once
+            all_papers = self.merge_papers(*results)
 
-            logger.info(f"Found {len(all_papers)} recent papers")
-            return all_papers[: settings.researcher.max_papers_per_query]
+            logger.info("Found {} recent papers", len(all_papers))
+            return all_papers[:max_papers]
 
         except Exception:
-            logger.error(f"Error searching recent papers: {traceback.format_exc()}")
+            logger.exception("Error searching recent papers")
             return []
 
-    @staticmethod
-    async def search_vector_store(query: str, existing_papers: list[Paper] = None) -> list[Paper]:
+    async def _fetch_recent_papers(self, category: str, max_results: int) -> list[Paper]:
+        """Fetch recent papers of one category, returning no papers on failure."""
+        try:
+            async with ARXIV_SEM, HTTP_SEM:
+                return await self.recent_papers_tool._arun(category=category, days_back=7, max_results=max_results)
+
+        except Exception as e:
+            logger.warning("Error searching recent papers in {}: {}", category, e)
+            return []
+
+    async def search_vector_store(self, query: str, seen: set[int] | None = None) -> list[Paper]:
         """
         Search for similar papers in the vector store.
 
         Args:
             query: The research query
-            existing_papers: Papers already found to avoid duplicates
+            seen: Title keys of papers already found, updated with the returned papers
 
         Returns:
             List of additional papers from vector store
         """
         try:
-            logger.info(f"Searching vector store for: {query}")
+            logger.info("Searching vector store for: {}", query)
 
-            # Search vector store for similar papers
-            similar_papers = vector_store.search_similar_papers(
+            # Search vector store for similar papers, off the event loop since embedding the query blocks
+            similar_papers = await asyncio.to_thread(
+                vector_store.search_similar_papers,
                 query=query,
                 k=5,  # Get top 5 similar papers
-                similarity_threshold=settings.vector_store.similarity_threshold,
+                similarity_threshold=self.similarity_threshold,
             )
 
-            # Add similar papers to existing papers (avoid duplicates)
-            if existing_papers is None:
-                existing_papers = []
+            # Keep only papers not already found (the store has set their similarity scores)
+            additional_papers = self.merge_papers((paper for paper, _ in similar_papers), seen=seen)
 
-            existing_titles = {paper.title.lower() for paper in existing_papers}
-            additional_papers = []
-
-            for paper, score in similar_papers:
-                if paper.title.lower() not in existing_titles:
-                    # Add similarity score to paper
-                    paper.similarity_score = score
-                    additional_papers.append(paper)
-
-            logger.info(f"Found {len(additional_papers)} additional papers in vector store")
+            logger.info("Found {} additional papers in vector store", len(additional_papers))
             return additional_papers
 
         except Exception:
-            logger.error(f"Error searching vector store: {traceback.format_exc()}")
+            logger.exception("Error searching vector store")
             return []
 
     async def web_search(self, query: str) -> list[dict]:
@@ -153,23 +169,24 @@ class SearchAgent:
             List of web search results
         """
         try:
-            if not settings.web_search.enabled:
+            if not get_settings().web_search.enabled:
                 logger.info("Web search disabled, skipping")
                 return []
 
-            logger.info(f"Performing web search for: {query}")
+            logger.info("Performing web search for: {}", query)
 
             # Use web search tool
-            web_results = await self.tools["web_search"]._arun(
-                query=query,
-                max_results=settings.web_search.max_results,
-            )
+            async with HTTP_SEM:
+                web_results = await self.web_search_tool._arun(
+                    query=query,
+                    max_results=self.web_search_max_results,
+                )
 
-            logger.info(f"Found {len(web_results)} web search results")
+            logger.info("Found {} web search results", len(web_results))
             return web_results
 
         except Exception:
-            logger.error(f"Error in web search: {traceback.format_exc()}")
+            logger.exception("Error in web search")
             return []
 
     async def comprehensive_search(self, query: str) -> tuple[list[Paper], list[dict]]:
@@ -183,26 +200,57 @@ class SearchAgent:
             Tuple of (papers, web_results, academic_results)
         """
         try:
-            logger.info(f"Performing comprehensive search for: {query}")
-
-            # Search papers from ArXiv
-            papers = await self.search_papers(query)
-
-            # Search vector store for additional papers
-            additional_papers = await self.search_vector_store(query, papers)
-            papers.extend(additional_papers)
+            logger.info("Performing comprehensive search for: {}", query)
+
+            # ArXiv, the vector store and the web are independent sources, search them concurrently;
+            # a source that fails contributes no results instead of discarding the others
+            results = await asyncio.gather(
+                self.search_papers(query),
+                self.search_vector_store(query),
+                self.web_search(query),
+                return_exceptions=True,
+            )
+            papers, similar_papers, web_results = (
+                [] if isinstance(result, Exception) else result for result in results
+            )
 
-            # Perform web search
-            web_results = await self.web_search(query)
+            # One running set of title keys dedups across all sources
+            papers = self.merge_papers(papers, similar_papers)
 
-            logger.info(f"Comprehensive search completed: {len(papers)} papers, {len(web_results)} web results.")
+            logger.info("Comprehensive search completed: {} papers, {} web results.", len(papers), len(web_results))
 
             return papers, web_results
 
         except Exception:
-            logger.error(f"Error in comprehensive search: {traceback.format_exc()}")
+            logger.exception("Error in comprehensive search")
             return [], []
 
+    @staticmethod
+    def merge_papers(*sources: Iterable[Paper], seen: set[int] | None = None) -> list[Paper]:
+        """
+        Merge paper lists in order, keeping the first paper of each normalized title.
+
+        Args:
+            sources: Paper lists to merge
+            seen: Title keys of papers already found, updated with the merged papers
+
+        Returns:
+            List of unique papers
+        """
+        if seen is None:
+            seen = set()
+
+        # Bound methods are looked up once instead of per paper
+        merged = []
+        add_seen, append = seen.add, merged.append
+        for paper in itertools.chain.from_iterable(sources):
+            key = paper.title_key
+            if key not in seen:
+                add_seen(key)
+                append(paper)
+
+        return merged
+
     async def process_state(self, state: SearchState) -> SearchState:
         """
         Process the search state.
@@ -214,23 +262,23 @@ class SearchAgent:
             Updated state with search results
         """
         try:
-            query = state["query"]
+            query = state.query
 
             # Perform comprehensive search
             papers, web_results = await self.comprehensive_search(query)
 
             # Update state
-            state["papers"] = papers
-            state["web_results"] = web_results
-            state["error"] = None
+            state.papers = papers
+            state.web_results = web_results
+            state.error = None
 
             return state
 
         except Exception as e:
-            logger.error(f"Error processing search state: {traceback.format_exc()}")
-            state["error"] = str(e)
-            state["papers"] = []
-            state["web_results"] = []
+            logger.exception("Error processing search state")
+            state.error = str(e)
+            state.papers = []
+            state.web_results = []
             return state
 
 
@@ -1,12 +1,13 @@
 """Summary Agent for summarizing search results."""
 
-import traceback
+import itertools
+from collections.abc import Iterable
 from typing import TypedDict
 
 from loguru import logger
 
 from ..models.schemas import Paper, ResearchResult
-from ..services.llm_service import llm_service
+from ..services.llm_cache import llm_cache
 
 
 class SummaryState(TypedDict):
@@ -44,19 +45,23 @@ class SummaryAgent:
             if not papers:
                 return "No papers found to summarize."
 
-            logger.info(f"Summarizing {len(papers)} papers for query: {query}")
+            logger.info("Summarizing {} papers for query: {}", len(papers), query)
 
             # Create summary prompt
             summary_prompt = self._create_paper_summary_prompt(papers, query)
 
-            # Get summary from LLM
-            summary = await llm_service.ainvoke_chat(summary_prompt)
+            # Get summary from LLM, or from the cache for a similar query over similar papers
+            summary = await llm_cache.ainvoke_chat(
+                summary_prompt,
+                query=self._semantic_key(query, (paper.title for paper in papers[:10])),
+                cache_namespace="paper_summary",
+            )
 
             logger.info("Successfully generated paper summary")
             return summary
 
         except Exception as e:
-            logger.error(f"Error summarizing papers: {traceback.format_exc()}")
+            logger.exception("Error summarizing papers")
             return f"Error generating summary: {str(e)}"
 
     async def summarize_web_results(self, web_results: list[dict], query: str) -> str:
@@ -74,19 +79,23 @@ class SummaryAgent:
             if not web_results:
                 return "No web results found to summarize."
 
-            logger.info(f"Summarizing {len(web_results)} web results for query: {query}")
+            logger.info("Summarizing {} web results for query: {}", len(web_results), query)
 
             # Create web summary prompt
             web_summary_prompt = self._create_web_summary_prompt(web_results, query)
 
-            # Get summary from LLM
-            summary = await llm_service.ainvoke_chat(web_summary_prompt)
+            # Get summary from LLM, or from the cache for a similar query over similar results
+            summary = await llm_cache.ainvoke_chat(
+                web_summary_prompt,
+                query=self._semantic_key(query, (result.get("title", "") for result in web_results[:5])),
+                cache_namespace="web_summary",
+            )
 
             logger.info("Successfully generated web results summary")
             return summary
 
         except Exception as e:
-            logger.error(f"Error summarizing web results: {traceback.format_exc()}")
+            logger.exception("Error summarizing web results")
             return f"Error generating web summary: {str(e)}"
 
     async def create_comprehensive_summary(
@@ -105,42 +114,71 @@ class SummaryAgent:
             Comprehensive summary string
         """
         try:
-            logger.info(f"Creating comprehensive summary for query: {query}")
+            # Without results there is nothing to synthesize, and a single source gets its own, cheaper summary
+            sources = [bool(papers), bool(web_results), bool(academic_results)]
+            if not any(sources):
+                return "No results found to summarize."
+            if sources.count(True) == 1:
+                if papers:
+                    return await self.summarize_papers(papers, query)
+                if web_results:
+                    return await self.summarize_web_results(web_results, query)
+
+            logger.info("Creating comprehensive summary for query: {}", query)
 
             # Create comprehensive summary prompt
             comprehensive_prompt = self._create_comprehensive_summary_prompt(
                 papers, web_results, academic_results, query
             )
 
-            # Get comprehensive summary from LLM
-            summary = await llm_service.ainvoke_chat(comprehensive_prompt)
+            # Get comprehensive summary from LLM, or from the cache for a similar query over similar results
+            titles = itertools.chain(
+                (paper.title for paper in papers[:5]),
+                (result.get("title", "") for result in web_results[:3]),
+                (result.get("title", "") for result in academic_results[:3]),
+            )
+            summary = await llm_cache.ainvoke_chat(
+                comprehensive_prompt,
+                query=self._semantic_key(query, titles),
+                cache_namespace="comprehensive_summary",
+            )
 
             logger.info("Successfully generated comprehensive summary")
             return summary
 
         except Exception as e:
-            logger.error(f"Error creating comprehensive summary: {traceback.format_exc()}")
+            logger.exception("Error creating comprehensive summary")
             return f"Error generating comprehensive summary: {str(e)}"
 
+    @staticmethod
+    def _semantic_key(query: str, titles: Iterable[str]) -> str:
+        """Build the text matched by the semantic cache: the query and the titles the prompt covers.
+
+        The prompt boilerplate is left out, otherwise it would dominate the similarity of the embeddings.
+        """
+        return "\n".join([query, *titles])
+
     @staticmethod
     def _create_paper_summary_prompt(papers: list[Paper], query: str) -> str:
         """Create prompt for paper summarization."""
-        papers_info = []
-        for i, paper in enumerate(papers[:10], 1):  # Limit to top 10 papers
-            papers_info.append(
+        # Limit to top 10 papers, joined once instead of appending to a list first
+        papers_info = "".join(
+            [
                 f"""
             Paper {i}:
             Title: {paper.title}
-            Authors: {", ".join(paper.authors[:3])}{"..." if len(paper.authors) > 3 else ""}
+            Authors: {paper.authors_short}
             Abstract: {paper.abstract[:500]}{"..." if len(paper.abstract) > 500 else ""}
             """
-            )
+                for i, paper in enumerate(papers[:10], 1)
+            ]
+        )
 
         return f"""
         Please provide a comprehensive summary of the following research papers related to the query: "{query}"
         
         Papers found:
-        {"".join(papers_info)}
+        {papers_info}
         
         Please create a summary that:
         1. Identifies the main research themes and trends
@@ -155,23 +193,24 @@ class SummaryAgent:
     @staticmethod
     def _create_web_summary_prompt(web_results: list[dict], query: str) -> str:
         """Create prompt for web results summarization."""
-        web_info = []
-        for i, result in enumerate(web_results[:5], 1):  # Limit to top 5 results
-            title = result.get("title", "No title")
-            snippet = result.get("snippet", result.get("description", "No description"))
-            web_info.append(
+        # Limit to top 5 results, joined once instead of appending to a list first
+        web_info = "".join(
+            [
                 f"""
             Result {i}:
-            Title: {title}
+            Title: {result.get("title", "No title")}
             Content: {snippet[:300]}{"..." if len(snippet) > 300 else ""}
             """
-            )
+                for i, result in enumerate(web_results[:5], 1)
+                for snippet in (result.get("snippet", result.get("description", "No description")),)
+            ]
+        )
 
         return f"""
         Please provide a summary of the following web search results related to the query: "{query}"
         
         Web results:
-        {"".join(web_info)}
+        {web_info}
         
         Please create a summary that:
         1. Identifies key information and insights
@@ -191,25 +230,23 @@ class SummaryAgent:
         # Paper summaries
         papers_summary = ""
         if papers:
-            papers_summary = f"\n\nResearch Papers Found ({len(papers)} papers):\n"
-            for i, paper in enumerate(papers[:5], 1):
-                papers_summary += f"{i}. {paper.title} - {', '.join(paper.authors[:2])}\n"
+            papers_summary = f"\n\nResearch Papers Found ({len(papers)} papers):\n" + "".join(
+                [f"{i}. {paper.title} - {', '.join(paper.authors[:2])}\n" for i, paper in enumerate(papers[:5], 1)]
+            )
 
         # Web results summary
         web_summary = ""
         if web_results:
-            web_summary = f"\n\nWeb Search Results ({len(web_results)} results):\n"
-            for i, result in enumerate(web_results[:3], 1):
-                title = result.get("title", "No title")
-                web_summary += f"{i}. {title}\n"
+            web_summary = f"\n\nWeb Search Results ({len(web_results)} results):\n" + "".join(
+                [f"{i}. {result.get('title', 'No title')}\n" for i, result in enumerate(web_results[:3], 1)]
+            )
 
         # Academic results summary
         academic_summary = ""
         if academic_results:
-            academic_summary = f"\n\nAcademic Search Results ({len(academic_results)} results):\n"
-            for i, result in enumerate(academic_results[:3], 1):
-                title = result.get("title", "No title")
-                academic_summary += f"{i}. {title}\n"
+            academic_summary = f"\n\nAcademic Search Results ({len(academic_results)} results):\n" + "".join(
+                [f"{i}. {result.get('title', 'No title')}\n" for i, result in enumerate(academic_results[:3], 1)]
+            )
 
         return f"""
         Please create a comprehensive research summary for the query: "{query}"
@@ -235,6 +272,7 @@ class SummaryAgent:
         academic_results: list[dict],
         query: str,
         search_time: float = 0.0,
+        summary: str | None = None,
     ) -> ResearchResult:
         """
         Create a ResearchResult object with summary.
@@ -245,6 +283,7 @@ class SummaryAgent:
             academic_results: List of academic search results
             query: Original research query
             search_time: Time taken for search
+            summary: Comprehensive summary already created for these results, created here if not given
 
         Returns:
             ResearchResult object
@@ -253,7 +292,8 @@ class SummaryAgent:
             logger.info("Creating research result with summary")
 
             # Create comprehensive summary
-            summary = await self.create_comprehensive_summary(papers, web_results, academic_results, query)
+            if summary is None:
+                summary = await self.create_comprehensive_summary(papers, web_results, academic_results, query)
 
             # Determine sources used
             sources = ["arxiv"]
@@ -278,7 +318,7 @@ class SummaryAgent:
             return research_result
 
         except Exception as e:
-            logger.error(f"Error creating research result: {traceback.format_exc()}")
+            logger.exception("Error creating research result")
             return ResearchResult(
                 papers=papers,
                 total_found=len(papers),
@@ -307,8 +347,10 @@ class SummaryAgent:
             # Create comprehensive summary
             summary = await self.create_comprehensive_summary(papers, web_results, academic_results, query)
 
-            # Create research result
-            research_result = await self.create_research_result(papers, web_results, academic_results, query)
+            # Create research result around the same summary instead of asking the LLM for it a second time
+            research_result = await self.create_research_result(
+                papers, web_results, academic_results, query, summary=summary
+            )
 
             # Update state
             state["summary"] = summary
@@ -318,7 +360,7 @@ class SummaryAgent:
             return state
 
         except Exception as e:
-            logger.error(f"Error processing summary state: {traceback.format_exc()}")
+            logger.exception("Error processing summary state")
             state["error"] = str(e)
             state["summary"] = f"Error generating summary: {str(e)}"
             state["research_result"] = None
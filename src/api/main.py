@@ -1,19 +1,20 @@
 """FastAPI application with chat endpoints and WebSocket support."""
 
 import asyncio
-import json
 import time
-import traceback
 import uuid
-from collections.abc import AsyncGenerator
+from collections import OrderedDict, deque
+from collections.abc import AsyncGenerator, Iterator
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from loguru import logger
+from pydantic import BaseModel
+from pydantic_core import to_json
 
-from ..agents.multi_agent_orchestrator import multi_agent_orchestrator
-from ..config.settings import settings
+from ..agents.multi_agent_orchestrator import get_orchestrator
+from ..config.settings import get_settings
 from ..models.schemas import (
     ChatRequest,
     ChatResponse,
@@ -33,8 +34,8 @@ from ..vectorstore.faiss_store import vector_store
 
 # Create FastAPI app
 app = FastAPI(
-    title=settings.app.name,
-    version=settings.app.version,
+    title=get_settings().app.name,
+    version=get_settings().app.version,
     description="AI/ML Research Chatbot Assistant with LangGraph and FastAPI",
 )
 
@@ -48,37 +49,138 @@ app.add_middleware(
 )
 
 # In-memory conversation storage. TODO: in production, use a proper database
-conversations: dict[str, list[dict[str, str]]] = {}
+# Histories are bounded deques, and the least recently used conversations are dropped beyond the limit
+conversations: OrderedDict[str, deque[dict[str, str]]] = OrderedDict()
+
+
+def _get_conversation_history(conversation_id: str) -> deque[dict[str, str]]:
+    """Get the history of a conversation, creating it if needed, and mark it as most recently used."""
+    conversation_history = conversations.get(conversation_id)
+    if conversation_history is None:
+        conversation_settings = get_settings().conversation
+        conversation_history = conversations[conversation_id] = deque(maxlen=conversation_settings.max_history)
+        if len(conversations) > conversation_settings.max_conversations:
+            conversations.popitem(last=False)
+    else:
+        conversations.move_to_end(conversation_id)
+
+    return conversation_history
+
+
+# Minimum number of characters of the response text sent per streaming chunk
+STREAM_CHUNK_SIZE = 64
+
+# Paper fields sent to streaming and WebSocket clients as the JSON content of a paper chunk
+PAPER_CHUNK_FIELDS = {"title", "authors", "summary", "url"}
+
+
+def _chunk_words(text: str, size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """Split text into chunks of whole words, each at least `size` characters long except the last."""
+    words: list[str] = []
+    length = 0
+    for word in text.split():
+        words.append(word)
+        length += len(word) + 1
+        if length >= size:
+            yield " ".join(words) + " "
+            words = []
+            length = 0
+
+    if words:
+        yield " ".join(words) + " "
+
+
+class StreamEvents:
+    """Encode the streaming chunks of one conversation as server-sent events.
+
+    A chunk of each type is dumped once as a template, so every further chunk only serializes its
+    content instead of building and dumping a new StreamingChunk.
+    """
+
+    def __init__(self, conversation_id: str):
+        self.conversation_id = conversation_id
+        self._tails: dict[tuple[str, bool], str] = {}
+
+    def __call__(self, content: str, chunk_type: str = "text", is_final: bool = False) -> str:
+        """Encode one chunk; the output is the same as StreamingChunk(...).model_dump_json()."""
+        tail = self._tails.get((chunk_type, is_final))
+        if tail is None:
+            # content is the first field, so the template's other fields follow its empty value
+            template = StreamingChunk(
+                content="", chunk_type=chunk_type, conversation_id=self.conversation_id, is_final=is_final
+            ).model_dump_json()
+            tail = self._tails[chunk_type, is_final] = template.removeprefix('{"content":""')
+
+        return f'data: {{"content":{to_json(content).decode()}{tail}\n\n'
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Serialize a response model straight to JSON bytes.
+
+    FastAPI would otherwise dump the model to a dict, validate it again against the response model
+    and encode it with json.dumps, which is costly for responses carrying lists of papers.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
 
 
 # WebSocket connection manager
 class ConnectionManager:
-    """Manages WebSocket connections."""
+    """Manages WebSocket connections.
+
+    Outgoing messages are queued per connection and sent by a sender task, one JSON message per frame.
+    Queuing never blocks, so a slow client only delays its own messages, and a connection whose send
+    fails is dropped.
+    """
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
+        self._queues: dict[WebSocket, asyncio.Queue[str]] = {}
+        self._senders: dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept a WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        self._queues[websocket] = asyncio.Queue()
+        self._senders[websocket] = asyncio.create_task(self._sender(websocket, self._queues[websocket]))
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self._remove(websocket)
+        sender = self._senders.pop(websocket, None)
+        if sender is not None:
+            sender.cancel()
 
     async def send_personal_message(self, message: str, websocket: WebSocket) -> None:
-        """Send a message to a specific WebSocket connection."""
-        await websocket.send_text(message)
+        """Queue a JSON message for a specific WebSocket connection, dropped if the connection is gone."""
+        queue = self._queues.get(websocket)
+        if queue is not None:
+            queue.put_nowait(message)
 
     async def broadcast(self, message: str) -> None:
-        """Broadcast a message to all connected WebSockets."""
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                logger.error(f"Error broadcasting message: {traceback.format_exc()}")
+        """Broadcast a JSON message to all connected WebSockets."""
+        for queue in self._queues.values():
+            queue.put_nowait(message)
+
+    def _remove(self, websocket: WebSocket) -> None:
+        """Stop tracking a connection and its queue."""
+        self.active_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+
+    async def _sender(self, websocket: WebSocket, queue: asyncio.Queue[str]) -> None:
+        """Send queued messages in order, one per frame."""
+        try:
+            while True:
+                await websocket.send_text(await queue.get())
+
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Error sending WebSocket messages")
+
+            # The connection is broken, stop queuing messages nobody will send
+            self._remove(websocket)
+            self._senders.pop(websocket, None)
 
 
 manager = ConnectionManager()
@@ -89,13 +191,13 @@ async def health_check() -> HealthResponse:
     """Health check endpoint."""
     return HealthResponse(
         status="healthy",
-        version=settings.app.version,
+        version=get_settings().app.version,
         uptime=time.time(),
     )
 
 
 @app.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest) -> ChatResponse:
+async def chat(request: ChatRequest) -> Response:
     """Main chat endpoint for research queries with HITL enabled.
 
     Args:
@@ -106,7 +208,7 @@ async def chat(request: ChatRequest) -> ChatResponse:
         conversation_id = request.conversation_id or str(uuid.uuid4())
 
         # Get conversation history
-        conversation_history = conversations.get(conversation_id, [])
+        conversation_history = _get_conversation_history(conversation_id)
 
         # Add user message to history
         conversation_history.append(
@@ -116,12 +218,12 @@ async def chat(request: ChatRequest) -> ChatResponse:
             }
         )
 
-        logger.info(f"Processing chat request: {request.message}")
+        logger.info("Processing chat request: {}", request.message)
 
         # Perform research
-        research_result = await multi_agent_orchestrator.research(
+        research_result = await get_orchestrator().research(
             query=request.message,
-            conversation_history=conversation_history,
+            conversation_history=list(conversation_history),
             conversation_id=conversation_id,
         )
 
@@ -151,13 +253,14 @@ async def chat(request: ChatRequest) -> ChatResponse:
                         "content": response_message,
                     }
                 )
-                conversations[conversation_id] = conversation_history[-settings.conversation.max_history :]
 
-                return ChatResponse(
-                    message=response_message,
-                    conversation_id=conversation_id,
-                    research_results=None,
-                    metadata={"hitl_session_id": session.session_id, "requires_confirmation": True},
+                return _json_response(
+                    ChatResponse(
+                        message=response_message,
+                        conversation_id=conversation_id,
+                        research_results=None,
+                        metadata={"hitl_session_id": session.session_id, "requires_confirmation": True},
+                    )
                 )
 
         # Normal flow - generate response message
@@ -171,21 +274,20 @@ async def chat(request: ChatRequest) -> ChatResponse:
             }
         )
 
-        # Update conversation storage
-        conversations[conversation_id] = conversation_history[-settings.conversation.max_history :]
-
         # Add papers to vector store for future similarity search
         if research_result.papers:
-            multi_agent_orchestrator.add_papers_to_vector_store(research_result.papers)
+            get_orchestrator().add_papers_to_vector_store(research_result.papers)
 
-        return ChatResponse(
-            message=response_message,
-            conversation_id=conversation_id,
-            research_results=research_result,
+        return _json_response(
+            ChatResponse(
+                message=response_message,
+                conversation_id=conversation_id,
+                research_results=research_result,
+            )
         )
 
     except Exception as e:
-        logger.error(f"Error in chat endpoint: {traceback.format_exc()}")
+        logger.exception("Error in chat endpoint")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -194,7 +296,7 @@ async def chat_stream(request: ChatRequest) -> StreamingResponse:
     """Streaming chat endpoint."""
     try:
         conversation_id = request.conversation_id or str(uuid.uuid4())
-        conversation_history = conversations.get(conversation_id, [])
+        conversation_history = _get_conversation_history(conversation_id)
 
         # Add user message to history
         conversation_history.append(
@@ -206,42 +308,31 @@ async def chat_stream(request: ChatRequest) -> StreamingResponse:
 
         async def generate_stream() -> AsyncGenerator[str]:
             """Generate streaming response."""
+            events = StreamEvents(conversation_id)
             try:
                 # Send initial chunk
-                yield f"data: {json.dumps(StreamingChunk(content='Starting research...', conversation_id=conversation_id).model_dump())}\n\n"
+                yield events("Starting research...")
 
                 # Perform research
-                research_result = await multi_agent_orchestrator.research(
+                research_result = await get_orchestrator().research(
                     query=request.message,
-                    conversation_history=conversation_history,
+                    conversation_history=list(conversation_history),
                 )
 
                 # Stream research results
                 if research_result.papers:
-                    yield f"data: {json.dumps(StreamingChunk(content=f'Found {len(research_result.papers)} papers', chunk_type='metadata', conversation_id=conversation_id).model_dump())}\n\n"
+                    yield events(f"Found {len(research_result.papers)} papers", chunk_type="metadata")
 
                     for paper in research_result.papers:
-                        paper_data = {
-                            "title": paper.title,
-                            "authors": paper.authors,
-                            "summary": paper.summary,
-                            "url": paper.url,
-                        }
-                        yield f"data: {json.dumps(StreamingChunk(content=json.dumps(paper_data), chunk_type='paper', conversation_id=conversation_id).model_dump())}\n\n"
+                        yield events(paper.model_dump_json(include=PAPER_CHUNK_FIELDS), chunk_type="paper")
 
                 # Generate and stream final response
                 response_message = await _generate_chat_response(research_result, request.message)
 
-                # Stream response in chunks
-                words = response_message.split()
-                for i, word in enumerate(words):
-                    chunk = StreamingChunk(
-                        content=word + " ",
-                        conversation_id=conversation_id,
-                        is_final=(i == len(words) - 1),
-                    )
-                    yield f"data: {json.dumps(chunk.model_dump())}\n\n"
-                    await asyncio.sleep(0.05)  # Small delay for streaming effect
+                # Stream response in chunks of whole words, as fast as the client reads them
+                chunks = list(_chunk_words(response_message))
+                for i, text in enumerate(chunks):
+                    yield events(text, is_final=i == len(chunks) - 1)
 
                 # Update conversation storage
                 conversation_history.append(
@@ -250,20 +341,14 @@ async def chat_stream(request: ChatRequest) -> StreamingResponse:
                         "content": response_message,
                     }
                 )
-                conversations[conversation_id] = conversation_history[-settings.conversation.max_history :]
 
                 # Add papers to vector store
                 if research_result.papers:
-                    multi_agent_orchestrator.add_papers_to_vector_store(research_result.papers)
+                    get_orchestrator().add_papers_to_vector_store(research_result.papers)
 
             except Exception as e:
-                logger.error(f"Error in streaming: {traceback.format_exc()}")
-                error_chunk = StreamingChunk(
-                    content=f"Error: {str(e)}",
-                    conversation_id=conversation_id,
-                    is_final=True,
-                )
-                yield f"data: {json.dumps(error_chunk.model_dump())}\n\n"
+                logger.exception("Error in streaming")
+                yield events(f"Error: {str(e)}", is_final=True)
 
         return StreamingResponse(
             generate_stream(),
@@ -272,7 +357,7 @@ async def chat_stream(request: ChatRequest) -> StreamingResponse:
         )
 
     except Exception as e:
-        logger.error(f"Error in streaming chat endpoint: {traceback.format_exc()}")
+        logger.exception("Error in streaming chat endpoint")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -284,11 +369,10 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         while True:
             # Receive message
             data = await websocket.receive_text()
-            message_data = json.loads(data)
-            ws_message = WebSocketMessage(**message_data)
+            ws_message = WebSocketMessage.model_validate_json(data)
 
             conversation_id = ws_message.conversation_id or str(uuid.uuid4())
-            conversation_history = conversations.get(conversation_id, [])
+            conversation_history = _get_conversation_history(conversation_id)
 
             # Add user message to history
             conversation_history.append(
@@ -300,21 +384,19 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
 
             # Send acknowledgment
             await manager.send_personal_message(
-                json.dumps(
-                    WebSocketResponse(
-                        type="ack",
-                        content="Processing your request...",
-                        conversation_id=conversation_id,
-                    ).model_dump()
-                ),
+                WebSocketResponse(
+                    type="ack",
+                    content="Processing your request...",
+                    conversation_id=conversation_id,
+                ).model_dump_json(),
                 websocket,
             )
 
             try:
                 # Perform research
-                research_result = await multi_agent_orchestrator.research(
+                research_result = await get_orchestrator().research(
                     query=ws_message.message,
-                    conversation_history=conversation_history,
+                    conversation_history=list(conversation_history),
                 )
 
                 # Generate response
@@ -322,39 +404,31 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
 
                 # Send response
                 await manager.send_personal_message(
-                    json.dumps(
-                        WebSocketResponse(
-                            type="response",
-                            content=response_message,
-                            conversation_id=conversation_id,
-                            metadata={
-                                "papers_found": len(research_result.papers),
-                                "search_time": research_result.search_time,
-                            },
-                        ).model_dump()
-                    ),
+                    WebSocketResponse(
+                        type="response",
+                        content=response_message,
+                        conversation_id=conversation_id,
+                        metadata={
+                            "papers_found": len(research_result.papers),
+                            "search_time": research_result.search_time,
+                        },
+                    ).model_dump_json(),
                     websocket,
                 )
 
-                # Send papers if any
+                # Send papers if any, all in one message whose content is a JSON array of papers
                 if research_result.papers:
-                    for paper in research_result.papers:
-                        paper_data = {
-                            "title": paper.title,
-                            "authors": paper.authors,
-                            "summary": paper.summary,
-                            "url": paper.url,
-                        }
-                        await manager.send_personal_message(
-                            json.dumps(
-                                WebSocketResponse(
-                                    type="paper",
-                                    content=json.dumps(paper_data),
-                                    conversation_id=conversation_id,
-                                ).model_dump()
-                            ),
-                            websocket,
-                        )
+                    papers_json = ",".join(
+                        paper.model_dump_json(include=PAPER_CHUNK_FIELDS) for paper in research_result.papers
+                    )
+                    await manager.send_personal_message(
+                        WebSocketResponse(
+                            type="papers",
+                            content=f"[{papers_json}]",
+                            conversation_id=conversation_id,
+                        ).model_dump_json(),
+                        websocket,
+                    )
 
                 # Update conversation storage
                 conversation_history.append(
@@ -363,37 +437,34 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
                         "content": response_message,
                     }
                 )
-                conversations[conversation_id] = conversation_history[-settings.conversation.max_history :]
 
                 # Add papers to vector store
                 if research_result.papers:
-                    multi_agent_orchestrator.add_papers_to_vector_store(research_result.papers)
+                    get_orchestrator().add_papers_to_vector_store(research_result.papers)
 
             except Exception as e:
-                logger.error(f"Error in WebSocket processing: {traceback.format_exc()}")
+                logger.exception("Error in WebSocket processing")
                 await manager.send_personal_message(
-                    json.dumps(
-                        WebSocketResponse(
-                            type="error",
-                            content=f"Error processing request: {str(e)}",
-                            conversation_id=conversation_id,
-                        ).model_dump()
-                    ),
+                    WebSocketResponse(
+                        type="error",
+                        content=f"Error processing request: {str(e)}",
+                        conversation_id=conversation_id,
+                    ).model_dump_json(),
                     websocket,
                 )
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception:
-        logger.error(f"WebSocket error: {traceback.format_exc()}")
+        logger.exception("WebSocket error")
         manager.disconnect(websocket)
 
 
 @app.post("/papers/search", response_model=PaperSearchResponse)
-async def search_papers(request: PaperSearchRequest) -> PaperSearchResponse:
+async def search_papers(request: PaperSearchRequest) -> Response:
     """Search for similar papers in the vector store."""
     try:
-        logger.info(f"Searching papers for: {request.query}")
+        logger.info("Searching papers for: {}", request.query)
 
         # Search vector store
         similar_papers = vector_store.search_similar_papers(
@@ -405,14 +476,16 @@ async def search_papers(request: PaperSearchRequest) -> PaperSearchResponse:
         # Extract papers and scores
         papers = [paper for paper, score in similar_papers]
 
-        return PaperSearchResponse(
-            papers=papers,
-            total_found=len(papers),
-            search_time=0.0,  # Vector search is very fast
+        return _json_response(
+            PaperSearchResponse(
+                papers=papers,
+                total_found=len(papers),
+                search_time=0.0,  # Vector search is very fast
+            )
         )
 
     except Exception as e:
-        logger.error(f"Error searching papers: {traceback.format_exc()}")
+        logger.exception("Error searching papers")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -424,7 +497,7 @@ async def get_paper_count() -> dict[str, int]:
         return {"count": count}
 
     except Exception as e:
-        logger.error(f"Error getting paper count: {traceback.format_exc()}")
+        logger.exception("Error getting paper count")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -442,7 +515,7 @@ async def get_hitl_session(session_id: str) -> HITLSessionResponse:
             session_id=session.session_id,
             original_query=session.original_query,
             suggested_query=session.suggested_query,
-            analysis_data=HITLQueryAnalysis(**session.analysis_data) if session.analysis_data else HITLQueryAnalysis(),
+            analysis_data=session.analysis_data or HITLQueryAnalysis(),
             conversation_id=session.conversation_id,
             status=session.status,
             created_at=session.created_at,
@@ -451,7 +524,7 @@ async def get_hitl_session(session_id: str) -> HITLSessionResponse:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting HITL session: {traceback.format_exc()}")
+        logger.exception("Error getting HITL session")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -461,7 +534,7 @@ async def confirm_hitl_query(request: HITLConfirmRequest) -> HITLConfirmResponse
     try:
         from ..services.hitl_service import hitl_service
 
-        logger.info(f"Confirming HITL session {request.session_id} with query: {request.final_query}")
+        logger.info("Confirming HITL session {} with query: {}", request.session_id, request.final_query)
 
         # Confirm the session
         session = hitl_service.confirm_session(
@@ -474,14 +547,14 @@ async def confirm_hitl_query(request: HITLConfirmRequest) -> HITLConfirmResponse
             raise HTTPException(status_code=404, detail="HITL session not found or expired")
 
         # Continue research with confirmed query
-        research_result = await multi_agent_orchestrator.continue_with_confirmed_query(
+        research_result = await get_orchestrator().continue_with_confirmed_query(
             hitl_session_id=request.session_id,
             confirmed_query=request.final_query,
         )
 
         # Update conversation storage if conversation_id exists
         if session.conversation_id:
-            conversation_history = conversations.get(session.conversation_id, [])
+            conversation_history = _get_conversation_history(session.conversation_id)
 
             # Generate response message
             response_message = await _generate_chat_response(research_result, request.final_query)
@@ -492,11 +565,10 @@ async def confirm_hitl_query(request: HITLConfirmRequest) -> HITLConfirmResponse
                     "content": response_message,
                 }
             )
-            conversations[session.conversation_id] = conversation_history[-settings.conversation.max_history :]
 
             # Add papers to vector store
             if research_result.papers:
-                multi_agent_orchestrator.add_papers_to_vector_store(research_result.papers)
+                get_orchestrator().add_papers_to_vector_store(research_result.papers)
 
         return HITLConfirmResponse(
             session_id=request.session_id,
@@ -508,7 +580,7 @@ async def confirm_hitl_query(request: HITLConfirmRequest) -> HITLConfirmResponse
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error confirming HITL query: {traceback.format_exc()}")
+        logger.exception("Error confirming HITL query")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -518,7 +590,7 @@ async def reject_hitl_query(session_id: str, user_response: str | None = None) -
     try:
         from ..services.hitl_service import hitl_service
 
-        logger.info(f"Rejecting HITL session {session_id}")
+        logger.info("Rejecting HITL session {}", session_id)
 
         session = hitl_service.reject_session(
             session_id=session_id,
@@ -541,7 +613,7 @@ async def reject_hitl_query(session_id: str, user_response: str | None = None) -
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error rejecting HITL query: {traceback.format_exc()}")
+        logger.exception("Error rejecting HITL query")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -558,9 +630,7 @@ async def list_hitl_sessions(conversation_id: str | None = None) -> dict[str, li
                 session_id=session.session_id,
                 original_query=session.original_query,
                 suggested_query=session.suggested_query,
-                analysis_data=(
-                    HITLQueryAnalysis(**session.analysis_data) if session.analysis_data else HITLQueryAnalysis()
-                ),
+                analysis_data=session.analysis_data or HITLQueryAnalysis(),
                 conversation_id=session.conversation_id,
                 status=session.status,
                 created_at=session.created_at,
@@ -571,7 +641,7 @@ async def list_hitl_sessions(conversation_id: str | None = None) -> dict[str, li
         return {"sessions": session_responses}
 
     except Exception as e:
-        logger.error(f"Error listing HITL sessions: {traceback.format_exc()}")
+        logger.exception("Error listing HITL sessions")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -591,7 +661,7 @@ async def _generate_chat_response(research_result: ResearchResult, query: str) -
             response_parts.extend(
                 [
                     f"{i}. **{paper.title}**",
-                    f"   Authors: {', '.join(paper.authors[:3])}{'...' if len(paper.authors) > 3 else ''}",
+                    f"   Authors: {paper.authors_short}",
                     f"   Summary: {paper.summary[:200]}{'...' if len(paper.summary) > 200 else ''}",
                     f"   Link: {paper.url}",
                     "",
@@ -604,24 +674,27 @@ async def _generate_chat_response(research_result: ResearchResult, query: str) -
         return "\n".join(response_parts)
 
     except Exception as e:
-        logger.error(f"Error generating chat response: {traceback.format_exc()}")
+        logger.exception("Error generating chat response")
         return f"I found some papers but encountered an error generating the response: {str(e)}"
 
 
 @app.on_event("startup")
 async def startup_event() -> None:
     """Application startup event."""
-    logger.info(f"Starting {settings.app.name} v{settings.app.version}")
-    logger.info(f"Server will run on {settings.server.host}:{settings.server.port}")
+    settings = get_settings()
+    logger.info("Starting {} v{}", settings.app.name, settings.app.version)
+    logger.info("Server will run on {}:{}", settings.server.host, settings.server.port)
 
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     """Application shutdown event."""
     logger.info("Shutting down application")
-    # Save vector store index
+    # Save vector store index, the background saver has usually written it already
     try:
-        vector_store.save_index()
-        logger.info("Vector store index saved")
+        await get_orchestrator().flush_vector_store()
+        if vector_store.has_unsaved_changes():
+            vector_store.save_index()
+            logger.info("Vector store index saved")
     except Exception:
-        logger.error(f"Error saving vector store: {traceback.format_exc()}")
+        logger.exception("Error saving vector store")
@@ -1,5 +1,6 @@
 """Configuration management using Pydantic settings."""
 
+import functools
 from enum import StrEnum
 
 from dotenv import load_dotenv
@@ -48,6 +49,10 @@ class ModelSettings(BaseSettings):
     )
     openai: OpenAISettings = Field(default_factory=OpenAISettings)
     ollama: OllamaSettings = Field(default_factory=OllamaSettings)
+    max_concurrency: int = Field(
+        default=16,
+        description="Maximum number of concurrent chat LLM requests",
+    )
 
 
 class ApplicationSettings(BaseSettings):
@@ -76,6 +81,10 @@ class ServerSettings(BaseSettings):
         default=8000,
         description="Server port",
     )
+    backlog: int = Field(
+        default=4096,
+        description="Maximum number of pending connections",
+    )
 
 
 class ResearcherSettings(BaseSettings):
@@ -92,10 +101,44 @@ class ResearcherSettings(BaseSettings):
         default=50,
         description="Maximum results to fetch from ArXiv",
     )
+    arxiv_max_concurrency: int = Field(
+        default=5,
+        description="Maximum number of concurrent ArXiv category queries",
+    )
+    max_concurrent_analyses: int = Field(
+        default=8,
+        description="Maximum number of papers analyzed by the LLM at once",
+    )
     graph_diagram_path: str = Field(
         default="./data/graph.png",
         description="Path to store LangGraph diagram",
     )
+    save_graph_diagram: bool = Field(
+        default=True,
+        description="Render the LangGraph diagram if it does not exist yet",
+    )
+
+
+class SecuritySettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="SECURITY_", env_file=".env", extra="ignore", case_sensitive=False)
+    llm_analysis_enabled: bool = Field(
+        default=False,
+        description="Ask the LLM for a second opinion on inputs flagged by the pattern checks",
+    )
+    max_scan_chars: int = Field(
+        default=8192,
+        description="Maximum number of input characters scanned for threats, longer inputs are flagged",
+    )
+
+
+class QueryAnalysisSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="QUERY_ANALYSIS_", env_file=".env", extra="ignore", case_sensitive=False
+    )
+    skip_llm_for_trivial: bool = Field(
+        default=True,
+        description="Build the analysis locally for short plain keyword queries instead of calling the LLM",
+    )
 
 
 class VectorStoreSettings(BaseSettings):
@@ -130,12 +173,36 @@ class WebSearchSettings(BaseSettings):
     )
 
 
+class LLMCacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="LLM_CACHE_", env_file=".env", extra="ignore", case_sensitive=False)
+    enabled: bool = Field(
+        default=True,
+        description="Cache chat LLM responses by exact prompt and by query similarity",
+    )
+    max_size: int = Field(
+        default=2048,
+        description="Maximum number of cached responses",
+    )
+    ttl: int = Field(
+        default=600,
+        description="Cached response lifetime in seconds",
+    )
+    similarity_threshold: float = Field(
+        default=0.92,
+        description="Minimum query similarity to reuse a cached response",
+    )
+
+
 class ConversationSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="CONVERSATION_", env_file=".env", extra="ignore", case_sensitive=False)
     max_history: int = Field(
         default=10,
         description="Maximum number of messages to keep in conversation history",
     )
+    max_conversations: int = Field(
+        default=10000,
+        description="Maximum number of conversations kept in memory, least recently used ones are dropped",
+    )
     timeout: int = Field(
         default=3600,
         description="Conversation timeout in seconds",
@@ -150,10 +217,16 @@ class Settings(BaseSettings):
     server: ServerSettings = Field(default_factory=ServerSettings)
     model: ModelSettings = Field(default_factory=ModelSettings)
     researcher: ResearcherSettings = Field(default_factory=ResearcherSettings)
+    security: SecuritySettings = Field(default_factory=SecuritySettings)
+    query_analysis: QueryAnalysisSettings = Field(default_factory=QueryAnalysisSettings)
     vector_store: VectorStoreSettings = Field(default_factory=VectorStoreSettings)
     web_search: WebSearchSettings = Field(default_factory=WebSearchSettings)
     conversation: ConversationSettings = Field(default_factory=ConversationSettings)
+    llm_cache: LLMCacheSettings = Field(default_factory=LLMCacheSettings)
 
 
-load_dotenv()
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, reading the environment only on the first call."""
+    load_dotenv(override=False)
+    return Settings()
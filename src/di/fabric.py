@@ -1,24 +1,28 @@
+import functools
+
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models.chat_models import BaseChatModel
 
-from ..config.settings import ModelType, settings
+from ..config.settings import ModelType, get_settings
 
 
+@functools.lru_cache(maxsize=1)
 def create_llm_instance() -> BaseChatModel:
-    match settings.model.type:
+    model_settings = get_settings().model
+    match model_settings.type:
         case ModelType.openai:
             from langchain_openai import ChatOpenAI
 
             return ChatOpenAI(
-                model=settings.model.openai.model,
-                api_key=settings.model.openai.api_key,
+                model=model_settings.openai.model,
+                api_key=model_settings.openai.api_key,
                 temperature=0.3,
             )
         case ModelType.ollama:
             from langchain_ollama import ChatOllama
 
             return ChatOllama(
-                model=settings.model.ollama.model,
+                model=model_settings.ollama.model,
                 temperature=0.3,
             )
         # TODO: add vLLM support
@@ -30,21 +34,23 @@ def create_llm_instance() -> BaseChatModel:
         #         base_url="http://localhost:8000/v1",
         #     )
         case _:
-            raise NotImplementedError(f"Model {settings.model.type} is not supported.")
+            raise NotImplementedError(f"Model {model_settings.type} is not supported.")
 
 
+@functools.lru_cache(maxsize=1)
 def create_embeddings_model_instance() -> Embeddings:
-    match settings.model.type:
+    model_settings = get_settings().model
+    match model_settings.type:
         case ModelType.openai:
             from langchain_openai import OpenAIEmbeddings
 
             return OpenAIEmbeddings(
-                model=settings.model.openai.embedding_model,
-                api_key=settings.model.openai.api_key,
+                model=model_settings.openai.embedding_model,
+                api_key=model_settings.openai.api_key,
             )
         case ModelType.ollama:
             from langchain_ollama import OllamaEmbeddings
 
-            return OllamaEmbeddings(model=settings.model.ollama.embedding_model)
+            return OllamaEmbeddings(model=model_settings.ollama.embedding_model)
         case _:
-            raise NotImplementedError(f"Model {settings.model.type} is not supported.")
+            raise NotImplementedError(f"Model {model_settings.type} is not supported.")
@@ -1,32 +1,36 @@
 #!/usr/bin/env python3
 
 import sys
-import traceback
+from importlib.util import find_spec
 
 import uvicorn
 from loguru import logger
 
-from src.config.settings import settings
+from src.config.settings import get_settings
 
 
 def main() -> None:
     """Main application entry point."""
     try:
-        logger.info(f"Starting {settings.app.name} v{settings.app.version}")
-        logger.info(f"Debug mode: {settings.app.debug}")
+        settings = get_settings()
+        logger.info("Starting {} v{}", settings.app.name, settings.app.version)
+        logger.info("Debug mode: {}", settings.app.debug)
 
         uvicorn.run(
             "src.api.main:app",
             host=settings.server.host,
             port=settings.server.port,
             reload=settings.app.debug,
+            loop="uvloop" if find_spec("uvloop") else "asyncio",
+            http="httptools" if find_spec("httptools") else "h11",
+            backlog=settings.server.backlog,
             log_level="info" if not settings.app.debug else "debug",
         )
 
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
     except Exception:
-        logger.error(f"Error starting application: {traceback.format_exc()}")
+        logger.exception("Error starting application")
         sys.exit(1)
 
 
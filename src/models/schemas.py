@@ -1,9 +1,11 @@
 """Pydantic models for API requests and responses."""
 
+import hashlib
 from datetime import datetime
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ChatMessage(BaseModel):
@@ -34,6 +36,9 @@ class ChatRequest(BaseModel):
 class Paper(BaseModel):
     """Research paper model."""
 
+    # Papers are shared between the vector store and results, changes go through model_copy
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="Paper title")
     authors: list[str] = Field(..., description="list of authors")
     abstract: str = Field(..., description="Paper abstract")
@@ -52,6 +57,20 @@ class Paper(BaseModel):
         description="Similarity score for vector search",
     )
 
+    # Cached properties are carried over by model_copy, so they must only derive from fields
+    # that copies never update (summaries and similarity scores are updated through copies)
+
+    @cached_property
+    def authors_short(self) -> str:
+        """First three authors, with an ellipsis if there are more, as shown in prompts and chat responses."""
+        return ", ".join(self.authors[:3]) + ("..." if len(self.authors) > 3 else "")
+
+    @cached_property
+    def title_key(self) -> int:
+        """Stable 64-bit fingerprint of the casefolded, whitespace-collapsed title, used to deduplicate papers."""
+        normalized = " ".join(self.title.casefold().split())
+        return int.from_bytes(hashlib.blake2b(normalized.encode(), digest_size=8).digest())
+
 
 class ResearchResult(BaseModel):
     """Research result containing papers and metadata."""
@@ -2,10 +2,11 @@
 
 import time
 import uuid
-from typing import Any
 
 from loguru import logger
 
+from ..models.schemas import HITLQueryAnalysis
+
 
 class HITLSession:
     """Represents a HITL confirmation session."""
@@ -15,7 +16,7 @@ class HITLSession:
         session_id: str,
         original_query: str,
         suggested_query: str,
-        analysis_data: dict[str, Any],
+        analysis_data: HITLQueryAnalysis,
         conversation_id: str | None = None,
     ):
         """Initialize a HITL session."""
@@ -43,7 +44,7 @@ class HITLService:
         self,
         original_query: str,
         suggested_query: str,
-        analysis_data: dict[str, Any],
+        analysis_data: HITLQueryAnalysis,
         conversation_id: str | None = None,
     ) -> HITLSession:
         """
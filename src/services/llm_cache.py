@@ -0,0 +1,160 @@
+"""Two-tier response cache for chat LLM calls."""
+
+import asyncio
+import hashlib
+import time
+import weakref
+from collections import OrderedDict
+
+import faiss
+import numpy as np
+from loguru import logger
+
+from ..config.settings import get_settings
+from .llm_service import llm_service
+
+
+class SemanticCache:
+    """Cached responses of one namespace, searchable by query embedding."""
+
+    def __init__(self, dimension: int):
+        self.index = faiss.IndexFlatIP(dimension)
+        self.entries: list[tuple[float, str]] = []
+
+    def search(self, query_vector: np.ndarray, threshold: float) -> str | None:
+        """Return the response of the most similar unexpired query above the threshold."""
+        if not self.entries:
+            return None
+
+        scores, indices = self.index.search(query_vector, 1)
+        score, idx = float(scores[0][0]), int(indices[0][0])
+        if idx < 0 or score < threshold:
+            return None
+
+        expires_at, response = self.entries[idx]
+        if expires_at < time.monotonic():
+            return None
+
+        logger.debug("Semantic cache hit with similarity {:.3f}", score)
+        return response
+
+    def add(self, query_vector: np.ndarray, response: str, expires_at: float) -> None:
+        """Store a response, starting over once the cache is full."""
+        if len(self.entries) >= get_settings().llm_cache.max_size:
+            self.index.reset()
+            self.entries.clear()
+
+        self.index.add(query_vector)
+        self.entries.append((expires_at, response))
+
+
+class LLMCache:
+    """Response cache in front of the chat LLM.
+
+    L1 matches the exact rendered prompt, L2 matches queries whose embedding is similar enough
+    to a previously answered one.
+    """
+
+    def __init__(self):
+        self._exact: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._semantic: dict[str, SemanticCache] = {}
+        # Entries live as long as a caller holds the lock, so waiters always share the holder's lock
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        logger.info("LLM Cache initialized")
+
+    async def ainvoke_chat(
+        self, prompt: str, query: str, cache_namespace: str = "default", system: str | None = None
+    ) -> str:
+        """
+        Invoke the chat LLM with a prompt, answering from the cache when possible.
+
+        Args:
+            prompt: The user prompt
+            query: The variable user query the prompt was rendered from
+            cache_namespace: Name of the prompt template, so different templates never share entries
+            system: Optional static system prompt sent before the prompt
+
+        Returns:
+            The LLM response text
+        """
+        cache_settings = get_settings().llm_cache
+        if not cache_settings.enabled:
+            return await llm_service.ainvoke_chat(prompt, system=system)
+
+        key = hashlib.sha256(f"{cache_namespace}\0{system or ''}\0{prompt}".encode()).hexdigest()
+
+        # Concurrent callers for the same prompt wait for a single LLM call
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+
+        async with lock:
+            response = self._exact_get(key)
+            if response is not None:
+                logger.debug("Exact cache hit in namespace {}", cache_namespace)
+                return response
+
+            query_vector = await self._embed(query)
+            semantic = self._semantic.get(cache_namespace)
+            if query_vector is not None and semantic is not None:
+                response = semantic.search(query_vector, cache_settings.similarity_threshold)
+                if response is not None:
+                    self._exact_put(key, response)
+                    return response
+
+            response = await llm_service.ainvoke_chat(prompt, system=system)
+
+            expires_at = time.monotonic() + cache_settings.ttl
+            self._exact_put(key, response, expires_at)
+            if query_vector is not None:
+                if semantic is None:
+                    semantic = self._semantic[cache_namespace] = SemanticCache(query_vector.shape[1])
+                semantic.add(query_vector, response, expires_at)
+
+            return response
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._exact.clear()
+        self._semantic.clear()
+
+    def _exact_get(self, key: str) -> str | None:
+        """Get an unexpired exact match and mark it as most recently used."""
+        entry = self._exact.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._exact[key]
+            return None
+
+        self._exact.move_to_end(key)
+        return response
+
+    def _exact_put(self, key: str, response: str, expires_at: float | None = None) -> None:
+        """Store an exact match, evicting the least recently used entry when full."""
+        if expires_at is None:
+            expires_at = time.monotonic() + get_settings().llm_cache.ttl
+
+        self._exact[key] = (expires_at, response)
+        self._exact.move_to_end(key)
+        if len(self._exact) > get_settings().llm_cache.max_size:
+            self._exact.popitem(last=False)
+
+    @staticmethod
+    async def _embed(query: str) -> np.ndarray | None:
+        """Embed the query as a normalized vector, or None if embedding fails."""
+        try:
+            embedding = await asyncio.to_thread(llm_service.embed_query, query.strip().lower())
+            query_vector = np.array([embedding]).astype("float32")
+            faiss.normalize_L2(query_vector)
+            return query_vector
+
+        except Exception as e:
+            logger.warning("Semantic cache lookup skipped, could not embed query: {}", e)
+            return None
+
+
+# Global LLM cache instance
+llm_cache = LLMCache()
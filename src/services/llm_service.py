@@ -1,13 +1,22 @@
 """Shared LLM and embeddings service for the entire project."""
 
-import traceback
+import asyncio
+import functools
 
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from loguru import logger
 
+from ..config.settings import get_settings
 from ..di.fabric import create_embeddings_model_instance, create_llm_instance
 
+# Shared bound on in-flight chat LLM requests across all agents
+LLM_SEM = asyncio.Semaphore(get_settings().model.max_concurrency or 16)
+
+# Maximum number of recent query embeddings kept for reuse
+EMBEDDING_CACHE_SIZE = 1024
+
 
 class LLMService:
     """Shared LLM and embeddings service."""
@@ -15,6 +24,12 @@ class LLMService:
     def __init__(self):
         self._chat_llm: BaseChatModel = create_llm_instance()
         self._embeddings_model: Embeddings = create_embeddings_model_instance()
+
+        # Thread-safe LRU, embed_query is called from worker threads
+        self._embed_query_cached = functools.lru_cache(maxsize=EMBEDDING_CACHE_SIZE)(self._embed_query)
+
+        # Chat requests in flight, keyed by system prompt and prompt
+        self._inflight: dict[tuple[str | None, str], asyncio.Task[str]] = {}
         logger.info("LLM Service initialized")
 
     @property
@@ -28,41 +43,69 @@ class LLMService:
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Embed a list of documents."""
         try:
-            logger.debug(f"Embedding {len(texts)} documents")
+            logger.debug("Embedding {} documents", len(texts))
             return self.embeddings_model.embed_documents(texts)
         except Exception:
-            logger.error(f"Error embedding documents: {traceback.format_exc()}")
+            logger.exception("Error embedding documents")
             raise
 
     def embed_query(self, text: str) -> list[float]:
-        """Embed a single query."""
+        """Embed a single query, reusing the embedding of a recently embedded identical query."""
+        return list(self._embed_query_cached(text))
+
+    def _embed_query(self, text: str) -> tuple[float, ...]:
+        """Embed a single query, as a tuple so cached embeddings cannot be mutated."""
         try:
-            logger.debug(f"Embedding query: {text[:50]}...")
-            return self.embeddings_model.embed_query(text)
+            logger.debug("Embedding query: {}...", text[:50])
+            return tuple(self.embeddings_model.embed_query(text))
         except Exception:
-            logger.error(f"Error embedding query: {traceback.format_exc()}")
+            logger.exception("Error embedding query")
             raise
 
     def invoke_chat(self, prompt: str) -> str:
         """Invoke the chat LLM with a prompt."""
         try:
-            logger.debug(f"Invoking chat LLM with prompt: {prompt[:100]}...")
+            logger.debug("Invoking chat LLM with prompt: {}...", prompt[:100])
             response = self.chat_llm.invoke(prompt)
             return response.content.strip()
         except Exception:
-            logger.error(f"Error invoking chat LLM: {traceback.format_exc()}")
+            logger.exception("Error invoking chat LLM")
             raise
 
-    async def ainvoke_chat(self, prompt: str) -> str:
-        """Async invoke the chat LLM with a prompt."""
+    async def ainvoke_chat(self, prompt: str, system: str | None = None) -> str:
+        """Async invoke the chat LLM with a prompt and an optional static system prompt.
+
+        Concurrent calls with the same prompts share a single LLM request.
+        """
+        key = (system, prompt)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._ainvoke_chat(prompt, system))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded, so a cancelled caller does not cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _ainvoke_chat(self, prompt: str, system: str | None) -> str:
+        """Send one chat request to the LLM."""
         try:
-            logger.debug(f"Async invoking chat LLM with prompt: {prompt[:100]}...")
-            response = await self.chat_llm.ainvoke(prompt)
+            logger.debug("Async invoking chat LLM with prompt: {}...", prompt[:100])
+            async with LLM_SEM:
+                response = await self.chat_llm.ainvoke(self._build_input(prompt, system))
             return response.content.strip()
         except Exception:
-            logger.error(f"Error async invoking chat LLM: {traceback.format_exc()}")
+            logger.exception("Error async invoking chat LLM")
             raise
 
+    @staticmethod
+    def _build_input(prompt: str, system: str | None) -> str | list[BaseMessage]:
+        """Build the chat input, sending the system prompt as the identical leading message."""
+        if system is None:
+            return prompt
+
+        return [SystemMessage(content=system), HumanMessage(content=prompt)]
+
 
 # Global LLM service instance
 llm_service = LLMService()
@@ -1,5 +1,7 @@
 """ArXiv research tool for finding academic papers."""
 
+import asyncio
+import threading
 import traceback
 from datetime import datetime, timedelta
 
@@ -8,9 +10,22 @@ from langchain.tools import BaseTool
 from loguru import logger
 from pydantic import BaseModel, Field
 
-from ..config.settings import settings
+from ..config.settings import get_settings
 from ..models.schemas import Paper
 
+# Searches run in worker threads. arxiv.Client holds a requests session, so each thread keeps one client and
+# reuses its keep-alive connections, without sharing the client's rate limiting state across threads
+_thread_local = threading.local()
+
+
+def _get_arxiv_client() -> arxiv.Client:
+    """Get the ArXiv client of the current thread, creating it on first use."""
+    client = getattr(_thread_local, "client", None)
+    if client is None:
+        client = _thread_local.client = arxiv.Client()
+
+    return client
+
 
 class ArxivSearchInput(BaseModel):
     """Input for ArXiv search tool."""
@@ -56,15 +71,14 @@ class ArxivTool(BaseTool):
             # Configure search parameters
             search_params = {
                 "query": query,
-                "max_results": min(max_results, settings.researcher.arxiv_max_results),
+                "max_results": min(max_results, get_settings().researcher.arxiv_max_results),
                 "sort_by": getattr(arxiv.SortCriterion, sort_by, arxiv.SortCriterion.Relevance),
                 "sort_order": getattr(arxiv.SortOrder, sort_order.title(), arxiv.SortOrder.Descending),
             }
 
             # Perform search
             search = arxiv.Search(**search_params)
-            client = arxiv.Client()
-            results = list(client.results(search))
+            results = list(_get_arxiv_client().results(search))
 
             papers = []
             for result in results:
@@ -97,8 +111,8 @@ class ArxivTool(BaseTool):
         sort_by: str = "relevance",
         sort_order: str = "descending",
     ) -> list[Paper]:
-        """Async version of ArXiv search."""
-        return self._run(query, max_results, sort_by, sort_order)
+        """Async version of ArXiv search, run in a worker thread since the arxiv client blocks."""
+        return await asyncio.to_thread(self._run, query, max_results, sort_by, sort_order)
 
 
 class RecentPapersInput(BaseModel):
@@ -152,15 +166,13 @@ class RecentPapersTool(BaseTool):
             )
 
             # Search with date filter
-            arxiv.Client()
             search = arxiv.Search(
                 query=date_query,
-                max_results=min(max_results, settings.researcher.arxiv_max_results),
+                max_results=min(max_results, get_settings().researcher.arxiv_max_results),
                 sort_by=arxiv.SortCriterion.SubmittedDate,
                 sort_order=arxiv.SortOrder.Descending,
             )
-            client = arxiv.Client()
-            results = list(client.results(search))
+            results = list(_get_arxiv_client().results(search))
 
             papers = []
             for result in results:
@@ -192,5 +204,5 @@ class RecentPapersTool(BaseTool):
         days_back: int = 7,
         max_results: int = 20,
     ) -> list[Paper]:
-        """Async version of recent papers search."""
-        return self._run(category, days_back, max_results)
+        """Async version of recent papers search, run in a worker thread since the arxiv client blocks."""
+        return await asyncio.to_thread(self._run, category, days_back, max_results)
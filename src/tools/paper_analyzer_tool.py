@@ -1,14 +1,18 @@
 """Paper analyzer tool using OpenAI for summarization and analysis."""
 
-import traceback
+import asyncio
 
 from langchain.tools import BaseTool
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from ..config.settings import get_settings
 from ..models.schemas import Paper
 from ..services.llm_service import llm_service
 
+# Bound on papers analyzed at once by the async path
+ANALYZE_SEM = asyncio.Semaphore(get_settings().researcher.max_concurrent_analyses or 8)
+
 
 class PaperAnalysisInput(BaseModel):
     """Input for paper analysis tool."""
@@ -51,7 +55,7 @@ class PaperAnalyzerTool(BaseTool):
             return []
 
         try:
-            logger.info(f"Analyzing {len(papers)} papers with analysis type: {analysis_type}")
+            logger.info("Analyzing {} papers with analysis type: {}", len(papers), analysis_type)
 
             analyzed_papers = []
             for paper in papers:
@@ -59,15 +63,15 @@ class PaperAnalyzerTool(BaseTool):
                     analyzed_paper = self._analyze_single_paper(paper, analysis_type, max_summary_length)
                     analyzed_papers.append(analyzed_paper)
                 except Exception:
-                    logger.warning(f"Error analyzing paper {paper.title}: {traceback.format_exc()}")
+                    logger.exception("Error analyzing paper {}", paper.title)
                     # Return original paper if analysis fails
                     analyzed_papers.append(paper)
 
-            logger.info(f"Successfully analyzed {len(analyzed_papers)} papers")
+            logger.info("Successfully analyzed {} papers", len(analyzed_papers))
             return analyzed_papers
 
         except Exception:
-            logger.error(f"Error in paper analysis: {traceback.format_exc()}")
+            logger.exception("Error in paper analysis")
             return papers  # Return original papers if analysis fails
 
     def _analyze_single_paper(
@@ -85,19 +89,29 @@ class PaperAnalyzerTool(BaseTool):
             summary = llm_service.invoke_chat(prompt)
 
             # Create enhanced paper with summary
-            return Paper(
-                title=paper.title,
-                authors=paper.authors,
-                abstract=paper.abstract,
-                summary=summary,
-                url=paper.url,
-                published_date=paper.published_date,
-                categories=paper.categories,
-                similarity_score=paper.similarity_score,
-            )
+            return paper.model_copy(update={"summary": summary})
+
+        except Exception:
+            logger.exception("Error analyzing paper {}", paper.title)
+            return paper
+
+    async def _aanalyze_single_paper(
+        self,
+        paper: Paper,
+        analysis_type: str,
+        max_summary_length: int,
+    ) -> Paper:
+        """Async version of single paper analysis, bounded by the shared analysis semaphore."""
+        try:
+            prompt = self._create_analysis_prompt(paper, analysis_type, max_summary_length)
+
+            async with ANALYZE_SEM:
+                summary = await llm_service.ainvoke_chat(prompt)
+
+            return paper.model_copy(update={"summary": summary})
 
         except Exception:
-            logger.error(f"Error analyzing paper {paper.title}: {traceback.format_exc()}")
+            logger.exception("Error analyzing paper {}", paper.title)
             return paper
 
     @staticmethod
@@ -162,8 +176,19 @@ class PaperAnalyzerTool(BaseTool):
         analysis_type: str = "summary",
         max_summary_length: int = 500,
     ) -> list[Paper]:
-        """Async version of paper analysis."""
-        return self._run(papers, analysis_type, max_summary_length)
+        """Async version of paper analysis, analyzing the papers concurrently."""
+        if not papers:
+            return []
+
+        logger.info("Analyzing {} papers with analysis type: {}", len(papers), analysis_type)
+
+        # Each paper falls back to the original on failure, so results keep the input order and length
+        analyzed_papers = await asyncio.gather(
+            *(self._aanalyze_single_paper(paper, analysis_type, max_summary_length) for paper in papers)
+        )
+
+        logger.info("Successfully analyzed {} papers", len(analyzed_papers))
+        return list(analyzed_papers)
 
 
 class PaperComparisonInput(BaseModel):
@@ -203,7 +228,7 @@ class PaperComparisonTool(BaseTool):
             comparison_aspects = ["methodology", "contributions", "results"]
 
         try:
-            logger.info(f"Comparing {len(papers)} papers across {comparison_aspects}")
+            logger.info("Comparing {} papers across {}", len(papers), comparison_aspects)
 
             # Create comparison prompt
             prompt = self._create_comparison_prompt(papers, comparison_aspects)
@@ -215,7 +240,7 @@ class PaperComparisonTool(BaseTool):
             return comparison
 
         except Exception as e:
-            logger.error(f"Error comparing papers: {traceback.format_exc()}")
+            logger.exception("Error comparing papers")
             return f"Error comparing papers: {str(e)}"
 
     @staticmethod
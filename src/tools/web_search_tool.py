@@ -7,7 +7,7 @@ from langchain.tools import BaseTool
 from loguru import logger
 from pydantic import BaseModel, Field
 
-from ..config.settings import settings
+from ..config.settings import get_settings
 
 
 class WebSearchInput(BaseModel):
@@ -44,7 +44,7 @@ class WebSearchTool(BaseTool):
 
     async def _arun(self, query: str, max_results: int = 5, academic_focus: bool = False) -> list[dict]:
         """Perform web search using MCP only."""
-        if not settings.web_search.enabled:
+        if not get_settings().web_search.enabled:
             logger.info("Web search is disabled")
             return []
 
@@ -2,13 +2,14 @@
 
 import os
 import pickle
+import threading
 import traceback
 
 import faiss
 import numpy as np
 from loguru import logger
 
-from ..config.settings import settings
+from ..config.settings import get_settings
 from ..models.schemas import Paper
 from ..services.llm_service import llm_service
 
@@ -19,9 +20,14 @@ class FAISSPaperStore:
     def __init__(self):
         self.index: faiss.Index | None = None
         self.papers: list[Paper] = []
-        self.dimension = settings.vector_store.vector_dimension
-        self.index_path = settings.vector_store.faiss_index_path
+        vector_store_settings = get_settings().vector_store
+        self.dimension = vector_store_settings.vector_dimension
+        self.index_path = vector_store_settings.faiss_index_path
         self.papers_path = os.path.join(os.path.dirname(self.index_path), "papers.pkl")
+        self._dirty = False
+
+        # The store is used from worker threads, the index and papers list must only change together
+        self._lock = threading.RLock()
 
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
@@ -47,11 +53,13 @@ class FAISSPaperStore:
             # Normalize embeddings for cosine similarity
             faiss.normalize_L2(embeddings_array)
 
-            # Add to FAISS index
-            self.index.add(embeddings_array)
+            with self._lock:
+                # Add to FAISS index
+                self.index.add(embeddings_array)
 
-            # Add papers to list
-            self.papers.extend(papers)
+                # Add papers to list
+                self.papers.extend(papers)
+                self._dirty = True
 
             logger.info(f"Successfully added {len(papers)} papers to vector store")
 
@@ -80,28 +88,21 @@ class FAISSPaperStore:
             # Normalize query vector
             faiss.normalize_L2(query_vector)
 
-            # Search in FAISS index
-            scores, indices = self.index.search(query_vector, min(k, len(self.papers)))
-
-            # Filter results by similarity threshold
-            threshold = similarity_threshold or settings.vector_store.similarity_threshold
-            results = []
-
-            for score, idx in zip(scores[0], indices[0], strict=True):
-                if idx >= 0 and score >= threshold:  # Valid index and above threshold
-                    paper = self.papers[idx]
-                    # Add similarity score to paper
-                    paper_with_score = Paper(
-                        title=paper.title,
-                        authors=paper.authors,
-                        abstract=paper.abstract,
-                        summary=paper.summary,
-                        url=paper.url,
-                        published_date=paper.published_date,
-                        categories=paper.categories,
-                        similarity_score=float(score),
-                    )
-                    results.append((paper_with_score, float(score)))
+            threshold = similarity_threshold or get_settings().vector_store.similarity_threshold
+            with self._lock:
+                # The store may have been cleared while embedding the query
+                if not self.papers:
+                    return []
+
+                # Search in FAISS index
+                scores, indices = self.index.search(query_vector, min(k, len(self.papers)))
+
+                # Filter results by similarity threshold, copying each paper with its similarity score in one pass
+                results = [
+                    (self.papers[idx].model_copy(update={"similarity_score": score}), score)
+                    for score, idx in zip(scores[0].tolist(), indices[0].tolist(), strict=True)
+                    if idx >= 0 and score >= threshold  # Valid index and above threshold
+                ]
 
             logger.info(f"Found {len(results)} similar papers")
             return results
@@ -112,14 +113,16 @@ class FAISSPaperStore:
 
     def get_paper_by_title(self, title: str) -> Paper | None:
         """Get a paper by its title."""
+        title_lower = title.lower()
         for paper in self.papers:
-            if paper.title.lower() == title.lower():
+            if paper.title.lower() == title_lower:
                 return paper
         return None
 
     def get_papers_by_category(self, category: str) -> list[Paper]:
         """Get all papers in a specific category."""
-        return [paper for paper in self.papers if category.lower() in [cat.lower() for cat in paper.categories]]
+        category_lower = category.lower()
+        return [paper for paper in self.papers if any(cat.lower() == category_lower for cat in paper.categories)]
 
     def get_recent_papers(self, days: int = 30) -> list[Paper]:
         """Get papers published within the last N days."""
@@ -132,19 +135,30 @@ class FAISSPaperStore:
         """Get total number of papers in the store."""
         return len(self.papers)
 
+    def has_unsaved_changes(self) -> bool:
+        """Check whether papers were added since the last save."""
+        return self._dirty
+
     def save_index(self) -> None:
-        """Save FAISS index and papers to disk."""
+        """Save FAISS index and papers to disk, skipping the write if nothing changed."""
         try:
-            if self.index is not None:
-                logger.info("Saving FAISS index and papers to disk")
+            with self._lock:
+                if self.index is None or not self._dirty:
+                    return
 
-                # Save FAISS index
-                faiss.write_index(self.index, self.index_path)
+                logger.info("Saving FAISS index and papers to disk")
 
-                # Save papers
-                with open(self.papers_path, "wb") as f:
+                # Write to temporary files and swap them in, so a crash never leaves a partial file behind.
+                # The two swaps are not atomic together: the papers go first and the index swap commits the
+                # save, so a crash in between leaves extra papers that _load_index drops again
+                faiss.write_index(self.index, f"{self.index_path}.tmp")
+                with open(f"{self.papers_path}.tmp", "wb") as f:
                     pickle.dump(self.papers, f)
 
+                os.replace(f"{self.papers_path}.tmp", self.papers_path)
+                os.replace(f"{self.index_path}.tmp", self.index_path)
+                self._dirty = False
+
                 logger.info("Successfully saved index and papers")
 
         except Exception:
@@ -155,13 +169,14 @@ class FAISSPaperStore:
         """Clear all papers from the index."""
         try:
             logger.info("Clearing vector store index")
-            self._create_new_index()
+            with self._lock:
+                self._create_new_index()
 
-            # Remove saved files
-            if os.path.exists(self.index_path):
-                os.remove(self.index_path)
-            if os.path.exists(self.papers_path):
-                os.remove(self.papers_path)
+                # Remove saved files
+                if os.path.exists(self.index_path):
+                    os.remove(self.index_path)
+                if os.path.exists(self.papers_path):
+                    os.remove(self.papers_path)
 
             logger.info("Successfully cleared vector store")
 
@@ -178,13 +193,13 @@ class FAISSPaperStore:
                 logger.warning("No papers to rebuild index with")
                 return
 
-            # Create new index
-            self._create_new_index()
+            with self._lock:
+                # Create new index
+                papers_to_rebuild = self.papers
+                self._create_new_index()
 
-            # Re-add all papers
-            papers_to_rebuild = self.papers.copy()
-            self.papers.clear()
-            self.add_papers(papers_to_rebuild)
+                # Re-add all papers
+                self.add_papers(papers_to_rebuild)
 
             logger.info("Successfully rebuilt vector store index")
 
@@ -216,6 +231,17 @@ class FAISSPaperStore:
                 with open(self.papers_path, "rb") as f:
                     self.papers = pickle.load(f)
 
+                # Papers and vectors are only ever appended together, so the index matches a prefix of the
+                # papers. Papers beyond it come from a save that crashed before swapping in its index
+                if len(self.papers) > self.index.ntotal:
+                    logger.warning(
+                        "Dropping {} papers saved without their index vectors",
+                        len(self.papers) - self.index.ntotal,
+                    )
+                    del self.papers[self.index.ntotal :]
+                elif len(self.papers) < self.index.ntotal:
+                    raise ValueError(f"Index has {self.index.ntotal} vectors but only {len(self.papers)} papers")
+
                 logger.info(f"Loaded {len(self.papers)} papers from existing index")
             else:
                 logger.info("No existing index found, creating new one")
@@ -231,6 +257,7 @@ class FAISSPaperStore:
             # Create FAISS index
             self.index = faiss.IndexFlatIP(self.dimension)  # Inner product for cosine similarity
             self.papers = []
+            self._dirty = False
             logger.info("Created new FAISS index")
 
         except Exception:
@@ -3,8 +3,13 @@ import uuid
 
 from loguru import logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from src.agents.multi_agent_orchestrator import multi_agent_orchestrator
-from src.config.settings import settings
+from src.config.settings import get_settings
 from src.models.schemas import (
     ChatRequest,
     ChatResponse,
@@ -52,7 +57,7 @@ async def chat(request: ChatRequest) -> ChatResponse:
     )
 
     # Update conversation storage
-    conversations[conversation_id] = conversation_history[-settings.conversation.max_history :]
+    conversations[conversation_id] = conversation_history[-get_settings().conversation.max_history :]
 
     # Add papers to vector store for future similarity search
     if research_result.papers:
@@ -135,6 +140,10 @@ async def main() -> None:
     result = await chat(request)
     logger.info(result)
 
+    # Wait for the background vector store write before the loop shuts down
+    await multi_agent_orchestrator.flush_vector_store()
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(main())
@@ -1,28 +1,32 @@
 """Example script demonstrating how to use the AI Research Assistant API."""
 
 import asyncio
-import json
 
-import requests
+import httpx
+import orjson
 import websockets
 from loguru import logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 HOST = "localHOST"
 PORT = "8000"
 
 
-def test_chat_endpoint() -> None:
+async def check_chat_endpoint(client: httpx.AsyncClient) -> None:
     """Test the basic chat endpoint."""
     logger.info("Testing chat endpoint...")
 
-    url = f"http://{HOST}:{PORT}/chat"
     data = {
         "message": "What are the latest advances in transformer architectures?",
         "stream": False,
     }
 
     try:
-        response = requests.post(url, json=data)
+        response = await client.post("/chat", json=data)
         response.raise_for_status()
 
         result = response.json()
@@ -33,50 +37,58 @@ def test_chat_endpoint() -> None:
         logger.error(f"Error: {e}")
 
 
-def test_streaming_endpoint() -> None:
+async def check_streaming_endpoint(client: httpx.AsyncClient) -> None:
     """Test the streaming chat endpoint."""
     logger.info("Testing streaming endpoint...")
 
-    url = f"http://{HOST}:{PORT}/chat/stream"
     data = {
         "message": "Recent developments in reinforcement learning",
         "stream": True,
     }
 
     try:
-        response = requests.post(url, json=data, stream=True)
-        response.raise_for_status()
+        async with client.stream("POST", "/chat/stream", json=data) as response:
+            response.raise_for_status()
+
+            logger.info("Streaming response:")
+
+            # Split whatever bytes have arrived into lines ourselves, so all events already
+            # buffered are handled per read instead of one iterator step per line
+            buffer = bytearray()
+            async for data in response.aiter_bytes():
+                buffer += data
+                *lines, rest = buffer.split(b"\n")
+                buffer = bytearray(rest)
 
-        logger.info("Streaming response:")
-        for line in response.iter_lines():
-            if line:
-                line_str = line.decode("utf-8")
-                if line_str.startswith("data: "):
-                    chunk_data = json.loads(line_str[6:])
-                    logger.info(f"Chunk: {chunk_data['content']}")
+                for line in lines:
+                    if line.startswith(b"data: "):
+                        chunk_data = orjson.loads(line[6:])
+                        logger.info(f"Chunk: {chunk_data['content']}")
 
     except Exception as e:
         logger.error(f"Error: {e}")
 
 
-async def test_websocket() -> None:
+async def check_websocket() -> None:
     """Test the WebSocket endpoint."""
     logger.info("Testing WebSocket endpoint...")
 
     uri = f"ws://{HOST}:{PORT}/ws"
 
     try:
-        async with websockets.connect(uri) as websocket:
+        # Runs on uvloop via main(); compression is off to skip per-frame deflate on small JSON messages
+        async with websockets.connect(uri, compression=None) as websocket:
             message = {
                 "message": "What are the newest papers on computer vision?",
                 "conversation_id": "test-conversation",
             }
 
-            await websocket.send(json.dumps(message))
+            # The server reads text frames
+            await websocket.send(orjson.dumps(message).decode())
 
             while True:
                 response = await websocket.recv()
-                data = json.loads(response)
+                data = orjson.loads(response)
                 logger.info(f"WebSocket response: {data}")
 
                 if data.get("type") == "response":
@@ -86,18 +98,17 @@ async def test_websocket() -> None:
         logger.error(f"Error: {e}")
 
 
-def test_paper_search() -> None:
+async def check_paper_search(client: httpx.AsyncClient) -> None:
     """Test the paper search endpoint."""
     logger.info("Testing paper search endpoint...")
 
-    url = f"http://{HOST}:{PORT}/papers/search"
     data = {
         "query": "machine learning",
         "limit": 5,
     }
 
     try:
-        response = requests.post(url, json=data)
+        response = await client.post("/papers/search", json=data)
         response.raise_for_status()
 
         result = response.json()
@@ -109,12 +120,12 @@ def test_paper_search() -> None:
         logger.error(f"Error: {e}")
 
 
-def test_health_check() -> None:
+async def check_health(client: httpx.AsyncClient) -> None:
     """Test the health check endpoint."""
     logger.info("Testing health check...")
 
     try:
-        response = requests.get(f"http://{HOST}:{PORT}/health")
+        response = await client.get("/health")
         response.raise_for_status()
 
         result = response.json()
@@ -125,25 +136,32 @@ def test_health_check() -> None:
         logger.error(f"Error: {e}")
 
 
-def main() -> None:
+async def main() -> None:
     """Run all tests."""
     logger.info("AI Research Assistant API Tests")
     logger.info("=" * 40)
 
-    # Test health check first
-    test_health_check()
+    # One keep-alive pool shared by every HTTP test
+    async with httpx.AsyncClient(
+        base_url=f"http://{HOST}:{PORT}",
+        timeout=None,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    ) as client:
+        # Independent endpoints run concurrently
+        await asyncio.gather(
+            check_health(client),
+            check_chat_endpoint(client),
+            check_paper_search(client),
+        )
 
-    # Test other endpoints
-    test_chat_endpoint()
-    test_streaming_endpoint()
-    test_paper_search()
+        await check_streaming_endpoint(client)
 
-    # Test WebSocket (async)
-    logger.info("Testing WebSocket (async)...")
-    asyncio.run(test_websocket())
+    # Test WebSocket
+    await check_websocket()
 
     logger.success("All tests completed!")
 
 
 if __name__ == "__main__":
-    main()
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(main())
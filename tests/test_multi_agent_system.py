@@ -7,6 +7,11 @@ from pathlib import Path
 
 from loguru import logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -55,4 +60,5 @@ async def test_multi_agent_system() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(test_multi_agent_system())
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(test_multi_agent_system())